@@ -0,0 +1,250 @@
+import hashlib
+import hmac
+import os
+import secrets
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+
+from database import conexao_leitura, conexao_escrita, aplicar_migracoes
+from registros import Usuario, colunas_sql, ler_registros
+
+# =========================================
+# 🔐 SISTEMA DE AUTENTICAÇÃO - SQLITE
+# =========================================
+
+# Custo do PBKDF2-SHA256 (OWASP 2023: 600 mil iterações); ajustável pelo ambiente.
+# Hashes com outro custo, ou no SHA-256 antigo sem salt, são regravados no próximo login.
+ITERACOES_PBKDF2 = int(os.environ.get('FARDAMENTOS_PBKDF2_ITERACOES', 600_000))
+ALGORITMO_HASH = 'pbkdf2_sha256'
+
+def make_hashes(password, iteracoes=None):
+    """Hash com salt aleatório no formato pbkdf2_sha256$iterações$salt$hash"""
+    iteracoes = iteracoes or ITERACOES_PBKDF2
+    salt = secrets.token_hex(16)
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode(), salt.encode(), iteracoes).hex()
+    return f"{ALGORITMO_HASH}${iteracoes}${salt}${digest}"
+
+def check_hashes(password, hashed_text):
+    """Confere a senha com um hash PBKDF2 ou com o SHA-256 sem salt das versões antigas"""
+    if hashed_text.startswith(ALGORITMO_HASH + '$'):
+        _, iteracoes, salt, digest = hashed_text.split('$')
+        calculado = hashlib.pbkdf2_hmac('sha256', password.encode(), salt.encode(), int(iteracoes)).hex()
+    else:
+        digest = hashed_text
+        calculado = hashlib.sha256(password.encode()).hexdigest()
+    return hmac.compare_digest(calculado, digest)
+
+def precisa_rehash(hashed_text):
+    """True para hashes antigos (SHA-256) ou com custo diferente de ITERACOES_PBKDF2"""
+    partes = hashed_text.split('$')
+    return partes[0] != ALGORITMO_HASH or int(partes[1]) != ITERACOES_PBKDF2
+
+def init_db():
+    """Inicializa o banco SQLite: migrações de schema e dados padrão; retorna True se concluiu"""
+    try:
+        # Migrações fora da transação de escrita (cada uma controla a sua)
+        aplicar_migracoes()
+        
+        # Usuários padrão: o hash, caro, só é calculado para os que faltam, e antes
+        # de abrir a transação, para não segurar o lock de escrita
+        usuarios_padrao = [
+            ('admin', 'Admin@2024!', 'Administrador', 'admin'),
+            ('vendedor', 'Vendas@123', 'Vendedor', 'vendedor')
+        ]
+        with conexao_leitura() as conn:
+            existentes = {linha[0] for linha in conn.execute('SELECT username FROM usuarios').fetchall()}
+        novos = [(username, make_hashes(senha), nome, tipo)
+                 for username, senha, nome, tipo in usuarios_padrao if username not in existentes]
+        
+        with conexao_escrita('usuarios', 'escolas') as conn:
+            cur = conn.cursor()
+            cur.executemany('''
+                INSERT OR IGNORE INTO usuarios (username, password_hash, nome_completo, tipo) 
+                VALUES (?, ?, ?, ?)
+            ''', novos)
+            
+            # Inserir escolas padrão
+            escolas_padrao = ['Municipal', 'Desperta', 'São Tadeu']
+            cur.executemany('INSERT OR IGNORE INTO escolas (nome) VALUES (?)', [(escola,) for escola in escolas_padrao])
+        
+        return True
+            
+    except Exception as e:
+        st.error(f"Erro ao inicializar banco: {str(e)}")
+        return False
+
+def verificar_login(username, password):
+    """Verifica credenciais no banco de dados"""
+    try:
+        with conexao_leitura() as conn:
+            cur = conn.cursor()
+            cur.execute('''
+                SELECT password_hash, nome_completo, tipo 
+                FROM usuarios 
+                WHERE username = ? AND ativo = 1
+            ''', (username,))
+            
+            resultado = cur.fetchone()
+        
+        if resultado and check_hashes(password, resultado[0]):
+            if precisa_rehash(resultado[0]):
+                # Migração transparente para o hash/custo atual; o login segue mesmo se falhar.
+                # O hash é calculado antes de abrir a transação, para não segurar o lock de escrita
+                novo_hash = make_hashes(password)
+                try:
+                    with conexao_escrita('usuarios') as conn:
+                        conn.execute(
+                            'UPDATE usuarios SET password_hash = ? WHERE username = ? AND password_hash = ?',
+                            (novo_hash, username, resultado[0])
+                        )
+                except Exception:
+                    pass
+            return True, resultado[1], resultado[2]  # sucesso, nome, tipo
+        else:
+            return False, "Credenciais inválidas", None
+            
+    except Exception as e:
+        return False, f"Erro: {str(e)}", None
+
+def alterar_senha(username, senha_atual, nova_senha):
+    """Altera a senha do usuário.
+
+    Conferência e novo hash (PBKDF2, caros) rodam fora da transação; a escrita só
+    troca o hash se ele ainda for o conferido, sem segurar o lock durante o cálculo.
+    """
+    try:
+        with conexao_leitura() as conn:
+            cur = conn.cursor()
+            cur.execute('SELECT password_hash FROM usuarios WHERE username = ?', (username,))
+            resultado = cur.fetchone()
+        
+        # Verificar senha atual
+        if not resultado or not check_hashes(senha_atual, resultado[0]):
+            return False, "Senha atual incorreta"
+        
+        # Atualizar senha
+        nova_senha_hash = make_hashes(nova_senha)
+        with conexao_escrita('usuarios') as conn:
+            cur = conn.cursor()
+            cur.execute(
+                'UPDATE usuarios SET password_hash = ? WHERE username = ? AND password_hash = ?',
+                (nova_senha_hash, username, resultado[0])
+            )
+            if cur.rowcount == 0:
+                return False, "A senha foi alterada por outra sessão; tente novamente"
+        return True, "Senha alterada com sucesso!"
+        
+    except Exception as e:
+        return False, f"Erro: {str(e)}"
+
+def listar_usuarios():
+    """Lista todos os usuários (apenas para admin)"""
+    try:
+        with conexao_leitura() as conn:
+            return ler_registros(conn, Usuario, f'''
+                SELECT {colunas_sql(Usuario, 'u')}
+                FROM usuarios u
+                ORDER BY u.username
+            ''')
+    except Exception as e:
+        st.error(f"Erro ao listar usuários: {e}")
+        return []
+
+def criar_usuario(username, password, nome_completo, tipo):
+    """Cria novo usuário (apenas para admin)"""
+    try:
+        password_hash = make_hashes(password)
+        with conexao_escrita('usuarios') as conn:
+            cur = conn.cursor()
+            cur.execute('''
+                INSERT INTO usuarios (username, password_hash, nome_completo, tipo)
+                VALUES (?, ?, ?, ?)
+            ''', (username, password_hash, nome_completo, tipo))
+            
+        return True, "Usuário criado com sucesso!"
+        
+    except sqlite3.IntegrityError:
+        return False, "Username já existe"
+    except Exception as e:
+        return False, f"Erro: {str(e)}"
+
+# =========================================
+# 🎫 SESSÕES (TOKENS ASSINADOS)
+# =========================================
+
+VALIDADE_SESSAO_HORAS = 12
+# Chave HMAC dos tokens; sem FARDAMENTOS_SEGREDO, uma aleatória por processo
+# (as sessões ficam em memória e não sobrevivem a um reinício de qualquer forma)
+SEGREDO_SESSOES = os.environ.get('FARDAMENTOS_SEGREDO') or secrets.token_hex(32)
+
+class SessoesAtivas:
+    """Sessões autenticadas em memória, identificadas por token assinado (HMAC).
+
+    Um refresh da página retoma a sessão pelo token, sem consultar a tabela
+    usuarios nem recalcular o hash da senha. Tokens com assinatura inválida são
+    recusados antes da busca.
+    """
+
+    def __init__(self, segredo=SEGREDO_SESSOES, validade=VALIDADE_SESSAO_HORAS * 3600):
+        self._segredo = segredo.encode()
+        self.validade = validade
+        self._sessoes = {}
+        self._lock = threading.Lock()
+
+    def _assinar(self, identificador):
+        return hmac.new(self._segredo, identificador.encode(), hashlib.sha256).hexdigest()
+
+    def criar(self, username, nome, tipo):
+        """Registra a sessão e retorna o token 'identificador.assinatura'"""
+        identificador = secrets.token_urlsafe(24)
+        agora = time.monotonic()
+        with self._lock:
+            # Limpa as expiradas aqui, no caminho raro, e não a cada consulta
+            for chave in [c for c, s in self._sessoes.items() if s[0] <= agora]:
+                del self._sessoes[chave]
+            self._sessoes[identificador] = (agora + self.validade, username, nome, tipo)
+        return f"{identificador}.{self._assinar(identificador)}"
+
+    def obter(self, token):
+        """(username, nome, tipo) de uma sessão válida, ou None"""
+        identificador, _, assinatura = (token or '').partition('.')
+        if not assinatura or not hmac.compare_digest(assinatura, self._assinar(identificador)):
+            return None
+        with self._lock:
+            sessao = self._sessoes.get(identificador)
+        if not sessao or sessao[0] <= time.monotonic():
+            return None
+        return sessao[1:]
+
+    def revogar(self, token):
+        identificador = (token or '').partition('.')[0]
+        with self._lock:
+            self._sessoes.pop(identificador, None)
+
+    def revogar_usuario(self, username, exceto=None):
+        """Encerra todas as sessões do usuário (ex.: após troca de senha), menos a do token `exceto`"""
+        manter = (exceto or '').partition('.')[0]
+        with self._lock:
+            for chave in [c for c, s in self._sessoes.items() if s[1] == username and c != manter]:
+                del self._sessoes[chave]
+
+    def __len__(self):
+        return len(self._sessoes)
+
+
+_sessoes = SessoesAtivas()
+
+def criar_sessao(username, nome, tipo):
+    return _sessoes.criar(username, nome, tipo)
+
+def obter_sessao(token):
+    return _sessoes.obter(token)
+
+def encerrar_sessao(token):
+    _sessoes.revogar(token)
+
+def encerrar_sessoes_usuario(username, exceto=None):
+    _sessoes.revogar_usuario(username, exceto)
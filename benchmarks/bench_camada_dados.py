@@ -0,0 +1,131 @@
+"""Latência da camada de dados (listagens, pedidos e relatórios) por volume de pedidos.
+
+Suíte pytest-benchmark: a base sintética (benchmarks/dados_sinteticos.py) cresce de
+um tamanho ao outro (--tamanhos) e cada operação é medida sem cache. O JSON traz
+commit, máquina e as estatísticas de cada operação por tamanho; salvar uma execução
+e comparar a seguinte mostra as regressões entre versões:
+
+    python -m pytest benchmarks/bench_camada_dados.py --benchmark-json=camada_dados.json
+    python -m pytest benchmarks/bench_camada_dados.py --tamanhos 20000 200000 --benchmark-save=anterior
+    python -m pytest benchmarks/bench_camada_dados.py --benchmark-compare --benchmark-compare-fail=median:20%
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+
+import pytest
+
+# database lê FARDAMENTOS_DB na importação: a base sintética nunca toca o banco do app
+PASTA = tempfile.mkdtemp()
+os.environ['FARDAMENTOS_DB'] = os.path.join(PASTA, 'benchmark.db')
+
+import database
+import dados_sinteticos
+import servicos
+
+# nome -> (função, argumentos nomeados, recebe a escola como primeiro argumento)
+CONSULTAS = {
+    'listar_pedidos_por_escola': (servicos.listar_pedidos_por_escola, {}, True),
+    'listar_produtos_por_escola': (servicos.listar_produtos_por_escola, {}, True),
+    'gerar_relatorio_vendas_por_escola': (servicos.gerar_relatorio_vendas_por_escola, {}, False),
+    'gerar_relatorio_vendas_por_escola (status)':
+        (servicos.gerar_relatorio_vendas_por_escola, {'status': 'Entregue'}, False),
+    'gerar_relatorio_produtos_por_escola': (servicos.gerar_relatorio_produtos_por_escola, {'limite': 10}, False),
+    'gerar_relatorio_produtos_por_escola (status)':
+        (servicos.gerar_relatorio_produtos_por_escola, {'limite': 10, 'status': 'Entregue'}, False),
+}
+
+
+@pytest.fixture(scope='session')
+def gerador(request):
+    """Base sintética sem pedidos; `crescer(n)` insere pedidos até a base ter n"""
+    opcao = request.config.getoption
+    aleatorio, produtos_por_escola = dados_sinteticos.gerar_base(opcao('escolas'), opcao('clientes'), 0,
+                                                                 opcao('semente'))
+    estado = {'pedidos': 0}
+
+    def crescer(pedidos):
+        if pedidos > estado['pedidos']:
+            with database.conexao_escrita() as conn:
+                dados_sinteticos.inserir_pedidos(conn, pedidos - estado['pedidos'], aleatorio, produtos_por_escola)
+            database.reconstruir_agregados()
+            estado['pedidos'] = pedidos
+
+    yield crescer, min(produtos_por_escola)
+    database.get_pool().fechar_todas()
+    shutil.rmtree(PASTA, ignore_errors=True)
+
+
+@pytest.fixture(scope='session')
+def escola_id(gerador, pedidos):
+    """Escola medida, com a base já em `pedidos` pedidos"""
+    crescer, escola_id = gerador
+    crescer(pedidos)
+    return escola_id
+
+
+@pytest.fixture
+def medir(benchmark, request, pedidos):
+    """medir(nome, função, preparar=None): uma chamada por rodada, sem cache, agrupada por operação"""
+    def medir(nome, funcao, preparar=None):
+        def sem_cache():
+            database.invalidar_cache()
+            return preparar() if preparar else None
+
+        benchmark.group = nome
+        benchmark.extra_info.update({'pedidos': pedidos, 'sqlite': sqlite3.sqlite_version})
+        return benchmark.pedantic(funcao, setup=sem_cache, rounds=request.config.getoption('repeticoes'),
+                                  iterations=1)
+    return medir
+
+
+@pytest.fixture
+def novo_pedido(escola_id):
+    """Cria pedidos de 2 itens na escola medida; os que sobrarem são excluídos no fim (a base mantém o tamanho)"""
+    with database.conexao_leitura() as conn:
+        cliente_id = conn.execute("SELECT MIN(id) FROM clientes").fetchone()[0]
+        produtos = conn.execute('''
+            SELECT id, preco FROM produtos WHERE escola_id = ?
+            ORDER BY estoque - reservado DESC LIMIT 2
+        ''', (escola_id,)).fetchall()
+    itens = [{'produto_id': p['id'], 'quantidade': 1, 'preco_unitario': p['preco'], 'subtotal': p['preco']}
+             for p in produtos]
+    criados = []
+
+    def criar():
+        sucesso, pedido_id = servicos.adicionar_pedido(cliente_id, escola_id, itens, '2026-01-15', 'PIX', 'benchmark')
+        assert sucesso, pedido_id
+        criados.append(pedido_id)
+        return pedido_id
+
+    yield criar, criados
+    for pedido_id in criados:
+        servicos.excluir_pedido(pedido_id)
+
+
+@pytest.mark.parametrize('nome', list(CONSULTAS))
+def test_consulta(medir, escola_id, nome):
+    funcao, kwargs, por_escola = CONSULTAS[nome]
+    args = (escola_id,) if por_escola else ()
+    resultado = medir(nome, lambda: funcao(*args, **kwargs))
+    # Os relatórios mostram o erro na tela e devolvem vazio, o que pareceria uma consulta muito rápida
+    dados = resultado[0] if isinstance(resultado, tuple) else resultado
+    assert len(dados) > 0, f"{nome} não retornou dados"
+
+
+def test_adicionar_pedido(medir, novo_pedido):
+    criar, _ = novo_pedido
+    medir('adicionar_pedido', criar)
+
+
+def test_excluir_pedido(medir, novo_pedido):
+    criar, criados = novo_pedido
+
+    def excluir(pedido_id):
+        sucesso, mensagem = servicos.excluir_pedido(pedido_id)
+        assert sucesso, mensagem
+        criados.remove(pedido_id)
+
+    # O pedido a excluir é criado na preparação de cada rodada, fora do tempo medido
+    medir('excluir_pedido', excluir, lambda: ((criar(),), {}))
@@ -0,0 +1,23 @@
+"""Opções da suíte pytest-benchmark (benchmarks/bench_*.py)."""
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [RAIZ, os.path.dirname(os.path.abspath(__file__))]
+
+
+def pytest_addoption(parser):
+    grupo = parser.getgroup('fardamentos', "base sintética dos benchmarks")
+    grupo.addoption('--tamanhos', type=int, nargs='+', default=[20_000, 200_000],
+                    help="quantidades de pedidos a medir (a base cresce de uma para a outra)")
+    grupo.addoption('--clientes', type=int, default=50_000)
+    grupo.addoption('--escolas', type=int, default=3)
+    grupo.addoption('--semente', type=int, default=42)
+    grupo.addoption('--repeticoes', type=int, default=5, help="medições por operação e tamanho")
+
+
+def pytest_generate_tests(metafunc):
+    # Um parâmetro de sessão: os testes rodam agrupados por tamanho, em ordem crescente
+    if 'pedidos' in metafunc.fixturenames:
+        tamanhos = sorted(set(metafunc.config.getoption('tamanhos')))
+        metafunc.parametrize('pedidos', tamanhos, scope='session', ids=[f"{t}_pedidos" for t in tamanhos])
@@ -0,0 +1,176 @@
+"""Gerador determinístico de dados sintéticos: escolas, produtos, clientes e pedidos.
+
+A mesma semente gera sempre a mesma base. Produtos cobrem categorias_produtos x
+todos_tamanhos em algumas cores; pedidos têm itens, status, pagamento e datas
+variados, com reservas de estoque e agregados de vendas consistentes:
+
+    python benchmarks/dados_sinteticos.py --saida /tmp/temporada.db
+    python benchmarks/dados_sinteticos.py --saida /tmp/pequena.db --clientes 5000 --pedidos 20000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DATA_FINAL = datetime(2025, 12, 31)
+DIAS_HISTORICO = 2 * 365
+
+PRODUTOS_POR_CATEGORIA = {
+    "Camisetas": ["Camiseta Manga Curta", "Camiseta Regata"],
+    "Calças/Shorts": ["Calça Tactel", "Short Saia"],
+    "Agasalhos": ["Jaqueta", "Moletom"],
+    "Acessórios": ["Meia", "Boné"],
+    "Outros": ["Avental"],
+}
+CORES = ["Branco", "Azul Marinho"]
+PRECOS_POR_CATEGORIA = {"Camisetas": 35.0, "Calças/Shorts": 55.0, "Agasalhos": 89.9, "Acessórios": 15.0, "Outros": 25.0}
+
+NOMES = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Gabriela", "Heitor", "Íris", "João",
+         "Larissa", "Marcos", "Natália", "Otávio", "Paula", "Rafael", "Sofia", "Tiago", "Valéria", "Yuri"]
+SOBRENOMES = ["Silva", "Santos", "Oliveira", "Souza", "Lima", "Pereira", "Costa", "Ferreira",
+              "Almeida", "Nascimento", "Araújo", "Melo", "Barbosa", "Rocha", "Conceição"]
+
+# Distribuição de status de uma temporada típica (a maioria já entregue)
+PESOS_STATUS = {"Entregue": 70, "Pendente": 10, "Em produção": 8, "Pronto para entrega": 5, "Cancelado": 7}
+STATUS_EM_ABERTO = {"Pendente", "Em produção", "Pronto para entrega"}
+
+
+def preparar_base(conn, aleatorio, escolas=3, clientes=50_000):
+    """Escolas, produtos (com saldo inicial no livro de estoque) e clientes.
+
+    Retorna {escola_id: [(produto_id, preco), ...]} para gerar os pedidos.
+    """
+    from servicos import categorias_produtos, todos_tamanhos
+
+    cur = conn.cursor()
+    cur.executemany("INSERT OR IGNORE INTO escolas (nome) VALUES (?)",
+                    [(f"Escola Sintética {i}",) for i in range(1, escolas + 1)])
+    ids_escolas = [linha[0] for linha in cur.execute(
+        "SELECT id FROM escolas WHERE nome LIKE 'Escola Sintética %' ORDER BY id").fetchall()]
+
+    produtos_por_escola = {}
+    for escola_id in ids_escolas:
+        produtos_por_escola[escola_id] = []
+        for categoria in categorias_produtos:
+            for nome in PRODUTOS_POR_CATEGORIA.get(categoria, [categoria]):
+                for tamanho in todos_tamanhos:
+                    for cor in CORES:
+                        preco = PRECOS_POR_CATEGORIA.get(categoria, 30.0)
+                        estoque = aleatorio.randint(0, 60)
+                        cur.execute('''
+                            INSERT INTO produtos (nome, categoria, tamanho, cor, preco, estoque, escola_id)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ''', (nome, categoria, tamanho, cor, preco, estoque, escola_id))
+                        produtos_por_escola[escola_id].append((cur.lastrowid, preco))
+                        cur.execute("INSERT INTO estoque_movimentos (produto_id, quantidade, motivo) VALUES (?, ?, ?)",
+                                    (cur.lastrowid, estoque, 'saldo_inicial'))
+
+    inicio = DATA_FINAL - timedelta(days=DIAS_HISTORICO)
+    linhas = []
+    for i in range(clientes):
+        nome = f"{aleatorio.choice(NOMES)} {aleatorio.choice(SOBRENOMES)} {aleatorio.choice(SOBRENOMES)}"
+        telefone = f"(79) 9{aleatorio.randint(1000, 9999)}-{aleatorio.randint(1000, 9999)}"
+        email = f"cliente{i + 1}@exemplo.com.br"
+        cadastro = (inicio + timedelta(days=aleatorio.randint(0, DIAS_HISTORICO))).strftime("%Y-%m-%d")
+        linhas.append((nome, telefone, email, cadastro))
+    cur.executemany("INSERT INTO clientes (nome, telefone, email, data_cadastro) VALUES (?, ?, ?, ?)", linhas)
+    return produtos_por_escola
+
+
+def inserir_pedidos(conn, quantidade, aleatorio, produtos_por_escola):
+    """Insere `quantidade` pedidos com 1 a 4 itens da escola do pedido.
+
+    Itens de pedidos em aberto entram como reserva; o estoque físico recebe a
+    mesma quantidade (com movimento no livro), para o disponível não ficar negativo.
+    """
+    from servicos import formas_pagamento
+
+    cur = conn.cursor()
+    ids_clientes = [linha[0] for linha in cur.execute("SELECT id FROM clientes").fetchall()]
+    status_possiveis, pesos = list(PESOS_STATUS), list(PESOS_STATUS.values())
+    escolas = list(produtos_por_escola)
+    inicio = DATA_FINAL - timedelta(days=DIAS_HISTORICO)
+    proximo_id = cur.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM pedidos").fetchone()[0]
+
+    pedidos, itens, reservas = [], [], {}
+    for pedido_id in range(proximo_id, proximo_id + quantidade):
+        escola_id = aleatorio.choice(escolas)
+        status = aleatorio.choices(status_possiveis, pesos)[0]
+        data = inicio + timedelta(minutes=aleatorio.randint(0, DIAS_HISTORICO * 24 * 60))
+        prevista = (data + timedelta(days=7)).strftime("%Y-%m-%d")
+        entregue = (data + timedelta(days=aleatorio.randint(1, 10))).strftime("%Y-%m-%d") if status == "Entregue" else None
+
+        quantidade_total, valor_total = 0, 0.0
+        for produto_id, preco in aleatorio.sample(produtos_por_escola[escola_id], aleatorio.randint(1, 4)):
+            qtd = aleatorio.randint(1, 3)
+            itens.append((pedido_id, produto_id, qtd, preco, qtd * preco))
+            quantidade_total += qtd
+            valor_total += qtd * preco
+            if status in STATUS_EM_ABERTO:
+                reservas[produto_id] = reservas.get(produto_id, 0) + qtd
+
+        pedidos.append((pedido_id, aleatorio.choice(ids_clientes), escola_id, status, data.strftime("%Y-%m-%d %H:%M:%S"),
+                        prevista, entregue, aleatorio.choice(formas_pagamento), quantidade_total, valor_total))
+
+    cur.executemany('''
+        INSERT INTO pedidos (id, cliente_id, escola_id, status, data_pedido, data_entrega_prevista,
+                             data_entrega_real, forma_pagamento, quantidade_total, valor_total)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', pedidos)
+    cur.executemany('''
+        INSERT INTO pedido_itens (pedido_id, produto_id, quantidade, preco_unitario, subtotal)
+        VALUES (?, ?, ?, ?, ?)
+    ''', itens)
+    cur.executemany("UPDATE produtos SET estoque = estoque + ?, reservado = reservado + ? WHERE id = ?",
+                    [(qtd, qtd, produto_id) for produto_id, qtd in reservas.items()])
+    cur.executemany("INSERT INTO estoque_movimentos (produto_id, quantidade, motivo) VALUES (?, ?, ?)",
+                    [(produto_id, qtd, 'sintetico') for produto_id, qtd in reservas.items()])
+
+
+def gerar_base(escolas=3, clientes=50_000, pedidos=200_000, semente=42):
+    """Gera a base completa no banco de FARDAMENTOS_DB e reconstrói os agregados.
+
+    Retorna (aleatório, produtos por escola) para quem quiser continuar inserindo pedidos.
+    """
+    import database
+
+    aleatorio = random.Random(semente)
+    database.aplicar_migracoes()
+    with database.conexao_escrita() as conn:
+        produtos_por_escola = preparar_base(conn, aleatorio, escolas, clientes)
+    with database.conexao_escrita() as conn:
+        inserir_pedidos(conn, pedidos, aleatorio, produtos_por_escola)
+    database.reconstruir_agregados()
+    database.invalidar_cache()
+    return aleatorio, produtos_por_escola
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--saida', required=True, help="arquivo do banco a criar (não pode existir)")
+    parser.add_argument('--escolas', type=int, default=3)
+    parser.add_argument('--clientes', type=int, default=50_000)
+    parser.add_argument('--pedidos', type=int, default=200_000)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.saida):
+        parser.error(f"{args.saida} já existe")
+    os.environ['FARDAMENTOS_DB'] = args.saida
+
+    inicio = time.perf_counter()
+    gerar_base(args.escolas, args.clientes, args.pedidos, args.semente)
+    print(f"Base gerada em {args.saida} ({time.perf_counter() - inicio:.1f} s): {args.escolas} escola(s), "
+          f"{args.clientes} cliente(s), {args.pedidos} pedido(s)")
+
+    import database
+    database.get_pool().fechar_todas()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
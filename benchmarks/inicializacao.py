@@ -0,0 +1,106 @@
+"""Tempo de inicialização: tela de login a frio e primeira abertura de cada página.
+
+Cada repetição roda o app (via streamlit.testing) em um processo Python novo,
+com banco temporário, como no primeiro acesso depois de subir o servidor:
+
+    python benchmarks/inicializacao.py
+    python benchmarks/inicializacao.py --repeticoes 10
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import importlib
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, 'app.py')
+sys.path.insert(0, RAIZ)
+
+# Módulos que a tela de login não deveria carregar (pandas, numpy e pyarrow já
+# vêm com o próprio streamlit; servicos é carregado pelo aquecimento do cache,
+# em segundo plano)
+MODULOS_PESADOS = ('plotly.express', 'exportacao', 'paginas.relatorios')
+
+PAGINAS = {
+    "📊 Dashboard": "paginas.dashboard",
+    "📦 Pedidos": "paginas.pedidos",
+    "👥 Clientes": "paginas.clientes",
+    "👕 Produtos": "paginas.produtos",
+    "📦 Estoque": "paginas.estoque",
+    "📈 Relatórios": "paginas.relatorios",
+}
+
+
+def _cronometrar(tempos, etapa, funcao):
+    inicio = time.perf_counter()
+    funcao()
+    tempos[etapa] = (time.perf_counter() - inicio) * 1000
+
+
+def medir_processo():
+    """Executado no processo filho: imprime os tempos (ms) em JSON.
+
+    As execuções via AppTest têm resolução de ~100 ms (o teste confere o fim do
+    script a cada 100 ms); o custo adiado de cada página aparece no import do módulo.
+    """
+    tempos = {}
+    _cronometrar(tempos, 'import streamlit', lambda: importlib.import_module('streamlit.testing.v1'))
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP, default_timeout=120)
+    _cronometrar(tempos, 'tela de login', app.run)
+    if app.exception:
+        raise RuntimeError(app.exception[0].value)
+    carregados = [modulo for modulo in MODULOS_PESADOS if modulo in sys.modules]
+
+    # Imports a frio de cada página, na ordem em que o usuário as abriria
+    for modulo in PAGINAS.values():
+        _cronometrar(tempos, f'import {modulo}', lambda: importlib.import_module(modulo))
+
+    app.sidebar.text_input[0].input("admin")
+    app.sidebar.text_input[1].input("Admin@2024!")
+    _cronometrar(tempos, 'entrar (Dashboard)', app.sidebar.button[0].click().run)
+    for pagina in list(PAGINAS)[1:]:
+        _cronometrar(tempos, f'render {pagina}', app.sidebar.radio[0].set_value(pagina).run)
+
+    print(json.dumps({'tempos': tempos, 'carregados_no_login': carregados}))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--processo-filho', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.processo_filho:
+        medir_processo()
+        return 0
+
+    medicoes = []
+    carregados = set()
+    for _ in range(args.repeticoes):
+        pasta = tempfile.mkdtemp()
+        ambiente = dict(os.environ, FARDAMENTOS_DB=os.path.join(pasta, 'benchmark.db'))
+        try:
+            saida = subprocess.run([sys.executable, os.path.abspath(__file__), '--processo-filho'],
+                                   env=ambiente, cwd=pasta, capture_output=True, text=True, check=True).stdout
+        finally:
+            shutil.rmtree(pasta, ignore_errors=True)
+        resultado = json.loads(saida.strip().splitlines()[-1])
+        medicoes.append(resultado['tempos'])
+        carregados.update(resultado['carregados_no_login'])
+
+    print(f"{'etapa':<28} {'mediana (ms)':>13} {'máximo (ms)':>12}")
+    for etapa in medicoes[0]:
+        valores = sorted(medicao[etapa] for medicao in medicoes)
+        print(f"{etapa:<28} {valores[len(valores) // 2]:>13.1f} {valores[-1]:>12.1f}")
+    print(f"\nMódulos pesados carregados na tela de login: {', '.join(sorted(carregados)) or 'nenhum'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Latência do login por custo do PBKDF2 e da retomada de sessão por token.
+
+Para cada quantidade de iterações mede o hash da senha e o verificar_login
+completo (consulta + PBKDF2); mede também o primeiro login de um hash SHA-256
+antigo (com a regravação) e a busca do token usada num refresh da página:
+
+    python benchmarks/login.py
+    python benchmarks/login.py --iteracoes 100000 600000 1000000 --repeticoes 10
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from medicao import mediana_ms
+
+SENHA = 'Senha@Benchmark1'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iteracoes', type=int, nargs='+', default=[100_000, 310_000, 600_000, 1_000_000],
+                        help="custos do PBKDF2-SHA256 a medir")
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    pasta = tempfile.mkdtemp()
+    os.environ['FARDAMENTOS_DB'] = os.path.join(pasta, 'benchmark.db')
+    import database
+    import autenticacao
+
+    database.aplicar_migracoes()
+
+    print(f"{'iterações':>10} {'hash (ms)':>10} {'login (ms)':>11}")
+    for iteracoes in sorted(args.iteracoes):
+        autenticacao.ITERACOES_PBKDF2 = iteracoes
+        usuario = f"usuario_{iteracoes}"
+        autenticacao.criar_usuario(usuario, SENHA, usuario, 'vendedor')
+        hash_senha = mediana_ms(lambda: autenticacao.make_hashes(SENHA), args.repeticoes)
+        login = mediana_ms(lambda: autenticacao.verificar_login(usuario, SENHA), args.repeticoes)
+        print(f"{iteracoes:>10} {hash_senha:>10.1f} {login:>11.1f}")
+
+    # Usuário com o hash antigo: o primeiro login confere o SHA-256 e regrava com PBKDF2
+    autenticacao.ITERACOES_PBKDF2 = max(args.iteracoes)
+    with database.conexao_escrita('usuarios') as conn:
+        conn.execute("INSERT INTO usuarios (username, password_hash, nome_completo) VALUES (?, ?, ?)",
+                     ('legado', hashlib.sha256(SENHA.encode()).hexdigest(), 'legado'))
+    inicio = time.perf_counter()
+    autenticacao.verificar_login('legado', SENHA)
+    print(f"\n1º login com hash SHA-256 antigo (regrava com {max(args.iteracoes)} iterações): "
+          f"{(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    token = autenticacao.criar_sessao('legado', 'legado', 'vendedor')
+    busca = mediana_ms(lambda: autenticacao.obter_sessao(token), max(args.repeticoes, 1000))
+    print(f"Retomada de sessão por token (refresh): {busca * 1000:.1f} µs")
+
+    database.get_pool().fechar_todas()
+    shutil.rmtree(pasta, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""Cronometragem compartilhada pelos scripts de benchmarks/."""
+import time
+
+
+def cronometrar(funcao, repeticoes, preparar=None):
+    """Mediana, mínimo e máximo em milissegundos; `preparar` roda antes de cada medição, fora do tempo"""
+    tempos = []
+    for _ in range(repeticoes):
+        if preparar:
+            preparar()
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    return {'mediana_ms': tempos[len(tempos) // 2], 'min_ms': tempos[0], 'max_ms': tempos[-1]}
+
+
+def mediana_ms(funcao, repeticoes, preparar=None):
+    """Só a mediana de cronometrar(), em milissegundos"""
+    return cronometrar(funcao, repeticoes, preparar)['mediana_ms']
@@ -0,0 +1,110 @@
+"""Latência do relatório "Produtos Mais Vendidos": contadores x agregação completa.
+
+Cresce pedido_itens até cada tamanho pedido e mede as duas consultas:
+
+    python benchmarks/top_produtos.py
+    python benchmarks/top_produtos.py --tamanhos 10000 100000 1000000 --repeticoes 20
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from medicao import mediana_ms
+
+ITENS_POR_PEDIDO = 3
+PRODUTOS_POR_ESCOLA = 200
+
+# Consulta do relatório antes dos contadores (agrega todo o histórico)
+SQL_AGREGACAO_COMPLETA = '''
+    SELECT pr.nome, pr.categoria, pr.tamanho, pr.cor, e.nome,
+           SUM(pi.quantidade) as total_vendido, SUM(pi.subtotal)
+    FROM pedido_itens pi
+    JOIN produtos pr ON pi.produto_id = pr.id
+    JOIN pedidos p ON pi.pedido_id = p.id
+    JOIN escolas e ON p.escola_id = e.id
+    GROUP BY pr.id, e.nome
+    ORDER BY total_vendido DESC
+    LIMIT 10
+'''
+
+
+def preparar_base(conn, escolas=3):
+    """Escolas, clientes e produtos fixos para os pedidos sintéticos"""
+    conn.executemany("INSERT INTO escolas (nome) VALUES (?)", [(f"Escola {i}",) for i in range(1, escolas + 1)])
+    conn.executemany("INSERT INTO clientes (nome) VALUES (?)", [(f"Cliente {i}",) for i in range(1, 501)])
+    conn.executemany(
+        "INSERT INTO produtos (nome, categoria, tamanho, cor, preco, estoque, escola_id) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(f"Produto {i}", "Camisetas", "M", "Branco", 30.0, 100, escola)
+         for escola in range(1, escolas + 1) for i in range(PRODUTOS_POR_ESCOLA)]
+    )
+
+
+def inserir_pedidos(conn, quantidade_itens, aleatorio, escolas=3):
+    """Insere pedidos com ITENS_POR_PEDIDO itens cada até somar `quantidade_itens` itens"""
+    inicio = datetime(2024, 1, 1)
+    ultimo = conn.execute("SELECT COALESCE(MAX(id), 0) FROM pedidos").fetchone()[0]
+    pedidos, itens = [], []
+    for pedido_id in range(ultimo + 1, ultimo + 1 + quantidade_itens // ITENS_POR_PEDIDO):
+        escola = aleatorio.randint(1, escolas)
+        data = inicio + timedelta(minutes=aleatorio.randint(0, 2 * 365 * 24 * 60))
+        pedidos.append((pedido_id, aleatorio.randint(1, 500), escola, data.strftime("%Y-%m-%d %H:%M:%S"),
+                        ITENS_POR_PEDIDO, ITENS_POR_PEDIDO * 30.0))
+        for _ in range(ITENS_POR_PEDIDO):
+            produto = (escola - 1) * PRODUTOS_POR_ESCOLA + aleatorio.randint(1, PRODUTOS_POR_ESCOLA)
+            itens.append((pedido_id, produto, 1, 30.0, 30.0))
+    conn.executemany('''
+        INSERT INTO pedidos (id, cliente_id, escola_id, data_pedido, quantidade_total, valor_total)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', pedidos)
+    conn.executemany('''
+        INSERT INTO pedido_itens (pedido_id, produto_id, quantidade, preco_unitario, subtotal)
+        VALUES (?, ?, ?, ?, ?)
+    ''', itens)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help="quantidades de linhas em pedido_itens a medir")
+    parser.add_argument('--repeticoes', type=int, default=10)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    pasta = tempfile.mkdtemp()
+    os.environ['FARDAMENTOS_DB'] = os.path.join(pasta, 'benchmark.db')
+    import database
+
+    database.aplicar_migracoes()
+    with database.conexao_escrita() as conn:
+        preparar_base(conn)
+
+    aleatorio = random.Random(args.semente)
+    print(f"{'itens':>10} {'contadores (ms)':>16} {'janela 30d (ms)':>16} {'agregação (ms)':>15}")
+    atual = 0
+    for tamanho in sorted(args.tamanhos):
+        with database.conexao_escrita() as conn:
+            inserir_pedidos(conn, tamanho - atual, aleatorio)
+        atual = tamanho
+        database.reconstruir_agregados('vendas_produtos')
+
+        fim = datetime(2025, 12, 31).date()
+        with database.conexao_leitura() as conn:
+            contadores = mediana_ms(lambda: database.top_produtos_vendidos(conn, limite=10), args.repeticoes)
+            janela = mediana_ms(lambda: database.top_produtos_vendidos(
+                conn, limite=10, data_inicio=fim - timedelta(days=30), data_fim=fim), args.repeticoes)
+            completa = mediana_ms(lambda: conn.execute(SQL_AGREGACAO_COMPLETA).fetchall(), args.repeticoes)
+        print(f"{tamanho:>10} {contadores:>16.2f} {janela:>16.2f} {completa:>15.2f}")
+
+    database.get_pool().fechar_todas()
+    shutil.rmtree(pasta, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
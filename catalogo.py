@@ -0,0 +1,64 @@
+# =========================================
+# 🗂️ ÍNDICE DE PRODUTOS EM MEMÓRIA
+# =========================================
+
+def disponivel(produto):
+    """Estoque livre para novos pedidos (físico menos reservas de pedidos em aberto)"""
+    return produto.estoque - produto.reservado
+
+
+def _ordenar(valores, ordem):
+    """Ordena pela lista de referência (ex.: todos_tamanhos); valores fora dela vão ao final"""
+    posicao = {valor: i for i, valor in enumerate(ordem)}
+    return sorted(valores, key=lambda valor: (posicao.get(valor, len(posicao)), valor))
+
+
+class IndiceProdutos:
+    """Produtos (registros.Produto) de uma escola indexados por id e por (categoria, nome, tamanho, cor).
+
+    Construído uma vez por lista de produtos em cache; todas as consultas do
+    seletor (opções de cada nível, produto escolhido, matriz) são buscas em dicionário.
+    """
+
+    def __init__(self, produtos, ordem_tamanhos=(), ordem_categorias=()):
+        self.por_id = {}
+        self.por_atributos = {}
+        self._filhos = {}
+
+        for produto in produtos:
+            chave = (produto.categoria, produto.nome, produto.tamanho, produto.cor)
+            self.por_id[produto.id] = produto
+            self.por_atributos.setdefault(chave, []).append(produto.id)
+            # Árvore categoria -> nome -> tamanho -> cor, com as opções de cada nível
+            for nivel in range(4):
+                self._filhos.setdefault(chave[:nivel], set()).add(chave[nivel])
+
+        ordens = {0: ordem_categorias, 2: ordem_tamanhos}
+        self._filhos = {
+            prefixo: _ordenar(valores, ordens.get(len(prefixo), ()))
+            for prefixo, valores in self._filhos.items()
+        }
+
+    def __len__(self):
+        return len(self.por_id)
+
+    def opcoes(self, *prefixo):
+        """Valores do próximo nível: opcoes() = categorias, opcoes(cat) = nomes, opcoes(cat, nome) = tamanhos..."""
+        return self._filhos.get(tuple(prefixo), [])
+
+    def produtos(self, categoria, nome, tamanho, cor):
+        """Produtos (registros) com exatamente esses atributos; normalmente um só"""
+        return [self.por_id[i] for i in self.por_atributos.get((categoria, nome, tamanho, cor), [])]
+
+    def produto(self, produto_id):
+        return self.por_id.get(produto_id)
+
+    def matriz_disponibilidade(self, categoria, nome):
+        """Disponível por cor (linhas) e tamanho (colunas) de um produto: (cores, tamanhos, {(cor, tamanho): qtd})"""
+        tamanhos = self.opcoes(categoria, nome)
+        cores = _ordenar({cor for tamanho in tamanhos for cor in self.opcoes(categoria, nome, tamanho)}, ())
+        estoque = {}
+        for tamanho in tamanhos:
+            for cor in self.opcoes(categoria, nome, tamanho):
+                estoque[(cor, tamanho)] = sum(disponivel(p) for p in self.produtos(categoria, nome, tamanho, cor))
+        return cores, tamanhos, estoque
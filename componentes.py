@@ -0,0 +1,192 @@
+import streamlit as st
+import pandas as pd
+from datetime import date, timedelta
+
+from servicos import (
+    todos_tamanhos, status_pedidos, formas_pagamento, LIMITE_BUSCA_CLIENTES, IMPORTACOES,
+    buscar_clientes, ler_planilha, grade_estoque_por_escola, atualizar_estoque_em_lote,
+    listar_pedidos_paginado, contar_pedidos
+)
+
+# =========================================
+# 🧩 COMPONENTES DA INTERFACE
+# =========================================
+
+def filtros_pedidos_ui(prefixo, escolas):
+    """Filtros de status, escola e período + tamanho de página; retorna (filtros, limite)"""
+    col1, col2, col3, col4, col5 = st.columns([2, 2, 1.5, 1.5, 1])
+    with col1:
+        status_filtro = st.selectbox("Filtrar por status:", ["Todos"] + status_pedidos, key=f"{prefixo}_status")
+    with col2:
+        escola_filtro = st.selectbox("Filtrar por escola:", ["Todas"] + [e.nome for e in escolas], key=f"{prefixo}_escola")
+    with col3:
+        data_inicio = st.date_input("De:", value=None, key=f"{prefixo}_de")
+    with col4:
+        data_fim = st.date_input("Até:", value=None, key=f"{prefixo}_ate")
+    with col5:
+        limite = st.selectbox("Por página:", [25, 50, 100, 200], key=f"{prefixo}_limite")
+    
+    filtros = {
+        'escola_id': next((e.id for e in escolas if e.nome == escola_filtro), None),
+        'status': None if status_filtro == "Todos" else status_filtro,
+        'data_inicio': data_inicio,
+        'data_fim': data_fim
+    }
+    return filtros, limite
+
+def busca_cliente_ui(prefixo, rotulo):
+    """Campo de busca + seleção entre os clientes encontrados; retorna o id escolhido ou None"""
+    termo = st.text_input(f"🔎 {rotulo}", placeholder="Nome, telefone ou email", key=f"{prefixo}_busca")
+    clientes = buscar_clientes(termo)
+    if not clientes:
+        st.info("👥 Nenhum cliente encontrado" if termo else "👥 Nenhum cliente cadastrado")
+        return None
+    
+    opcoes = {f"{c.nome} · {c.telefone or c.email or 'sem contato'} (#{c.id})": c.id for c in clientes}
+    escolhido = st.selectbox(
+        f"Clientes encontrados ({len(opcoes)}{'+' if len(opcoes) == LIMITE_BUSCA_CLIENTES else ''}):",
+        list(opcoes),
+        key=f"{prefixo}_cliente"
+    )
+    return opcoes.get(escolhido)
+
+PERIODOS_RELATORIO = ["Todo o período", "Este mês", "Últimos 30 dias", "Este ano", "Personalizado"]
+
+def filtros_relatorio_ui(prefixo):
+    """Período, status e forma de pagamento dos relatórios; retorna dict para gerar_relatorio_*"""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        periodo = st.selectbox("Período:", PERIODOS_RELATORIO, key=f"{prefixo}_periodo")
+    with col2:
+        status_filtro = st.selectbox("Status:", ["Todos (exceto cancelados)"] + status_pedidos, key=f"{prefixo}_status")
+    with col3:
+        pagamento_filtro = st.selectbox("Pagamento:", ["Todas"] + formas_pagamento, key=f"{prefixo}_pagamento")
+    
+    hoje = date.today()
+    data_inicio = data_fim = None
+    if periodo == "Este mês":
+        data_inicio = hoje.replace(day=1)
+    elif periodo == "Últimos 30 dias":
+        data_inicio = hoje - timedelta(days=29)
+    elif periodo == "Este ano":
+        data_inicio = hoje.replace(month=1, day=1)
+    elif periodo == "Personalizado":
+        col1, col2 = st.columns(2)
+        with col1:
+            data_inicio = st.date_input("De:", value=hoje.replace(day=1), key=f"{prefixo}_de")
+        with col2:
+            data_fim = st.date_input("Até:", value=hoje, key=f"{prefixo}_ate")
+    
+    return {
+        'data_inicio': data_inicio,
+        'data_fim': data_fim,
+        'status': None if status_filtro not in status_pedidos else status_filtro,
+        'forma_pagamento': None if pagamento_filtro == "Todas" else pagamento_filtro
+    }
+
+def importacao_ui(tipo, escolas):
+    """Upload de CSV/XLSX com validação, prévia (dry-run) e confirmação da importação"""
+    config = IMPORTACOES[tipo]
+    st.caption(f"Colunas esperadas: {', '.join(config['colunas'])}")
+    arquivo = st.file_uploader("📄 Arquivo CSV ou XLSX", type=["csv", "xlsx"], key=f"importar_{tipo}")
+    
+    if arquivo:
+        try:
+            validas, erros = config['validar'](ler_planilha(arquivo), escolas)
+        except Exception as e:
+            st.error(f"❌ Não foi possível ler o arquivo: {str(e)}")
+            return
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Linhas válidas", len(validas))
+        with col2:
+            st.metric("Linhas com erro", len(erros))
+        
+        if erros:
+            st.subheader("⚠️ Linhas com erro (não serão importadas)")
+            st.dataframe(pd.DataFrame(erros, columns=['Linha', 'Erro']), use_container_width=True, hide_index=True)
+        
+        if validas:
+            st.subheader("👀 Prévia")
+            st.dataframe(pd.DataFrame(validas[:20], columns=config['preview']), use_container_width=True, hide_index=True)
+            
+            if st.button(f"✅ Confirmar Importação ({len(validas)} linhas)", type="primary", key=f"confirmar_importar_{tipo}"):
+                sucesso, msg = config['gravar'](validas)
+                if sucesso:
+                    st.success(msg)
+                else:
+                    st.error(msg)
+
+def grade_tamanhos_ui(escola_id, editavel=False):
+    """Matriz produto/cor x tamanho da escola; se editável, grava as células alteradas em lote"""
+    estoques, ids = grade_estoque_por_escola(escola_id)
+    if estoques.empty:
+        return
+    
+    # Só os tamanhos que a escola usa, na ordem de todos_tamanhos
+    tamanhos = [t for t in todos_tamanhos if estoques[t].notna().any()]
+    grade = estoques[tamanhos].reset_index()
+    
+    if not editavel:
+        st.dataframe(grade, use_container_width=True, hide_index=True)
+        return
+    
+    editado = st.data_editor(
+        grade,
+        column_config={t: st.column_config.NumberColumn(t, min_value=0, step=1) for t in tamanhos},
+        disabled=['Categoria', 'Produto', 'Cor'],
+        hide_index=True,
+        use_container_width=True,
+        key=f"grade_estoque_{escola_id}"
+    )
+    
+    ajustes, ignorados = [], 0
+    for tamanho in tamanhos:
+        antes = grade[tamanho]
+        depois = editado[tamanho]
+        mudou = (antes.isna() != depois.isna()) | (antes.fillna(-1) != depois.fillna(-1))
+        for linha in mudou[mudou].index:
+            produto_id = ids[tamanho].iloc[linha]
+            if pd.isna(produto_id) or pd.isna(depois[linha]):
+                ignorados += 1
+            else:
+                ajustes.append((int(produto_id), int(depois[linha])))
+    
+    if ignorados:
+        st.warning(f"⚠️ {ignorados} célula(s) sem produto único cadastrado (ou apagadas) serão ignoradas")
+    if ajustes:
+        st.info(f"✏️ {len(ajustes)} alteração(ões) pendente(s)")
+        if st.button("💾 Salvar Grade", type="primary", key=f"salvar_grade_{escola_id}"):
+            sucesso, resultado = atualizar_estoque_em_lote(ajustes)
+            if sucesso:
+                st.success(f"✅ Estoque atualizado para {len(resultado)} produto(s)!")
+            else:
+                st.error(resultado)
+
+def pagina_pedidos_ui(prefixo, filtros, limite):
+    """Carrega só a página atual (paginação por cursor) e desenha os botões de navegação"""
+    chave_cursores = f"{prefixo}_cursores"
+    assinatura = (tuple(filtros.values()), limite)
+    if st.session_state.get(f"{prefixo}_assinatura") != assinatura:
+        # Filtros mudaram: volta para a primeira página
+        st.session_state[f"{prefixo}_assinatura"] = assinatura
+        st.session_state[chave_cursores] = [None]
+    cursores = st.session_state[chave_cursores]
+    
+    pedidos, proximo = listar_pedidos_paginado(**filtros, apos=cursores[-1], limite=limite)
+    total = contar_pedidos(**filtros)
+    total_paginas = max(1, -(-total // limite))
+    
+    # Callbacks rodam antes do próximo rerun, sem precisar de st.rerun()
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("⬅️ Anterior", key=f"{prefixo}_anterior", disabled=len(cursores) == 1,
+                  on_click=cursores.pop)
+    with col2:
+        st.write(f"Página {len(cursores)} de {total_paginas} — {total} pedido(s)")
+    with col3:
+        st.button("Próxima ➡️", key=f"{prefixo}_proxima", disabled=proximo is None,
+                  on_click=cursores.append, args=(proximo,))
+    
+    return pedidos
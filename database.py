@@ -0,0 +1,726 @@
+import heapq
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# =========================================
+# 🗄️ POOL DE CONEXÕES - SQLITE
+# =========================================
+
+DB_PATH = os.environ.get('FARDAMENTOS_DB', 'fardamentos.db')
+MAX_LEITORES_OCIOSOS = 4
+
+# Aplicados em toda conexão aberta pelo pool
+PRAGMAS_CONEXAO = (
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA foreign_keys = ON',
+    'PRAGMA busy_timeout = 5000',
+    'PRAGMA cache_size = -16000',      # ~16 MB por conexão
+    'PRAGMA mmap_size = 134217728',    # 128 MB
+    'PRAGMA temp_store = MEMORY',
+)
+
+
+class PoolConexoes:
+    """Pool de conexões SQLite compartilhado pelo processo inteiro.
+
+    Leituras emprestam uma conexão de uma fila de leitores ociosos (reutilizada
+    entre reruns e sessões); escritas passam por uma única conexão protegida
+    por lock, com commit/rollback automáticos.
+    """
+
+    def __init__(self, caminho=DB_PATH, max_leitores=MAX_LEITORES_OCIOSOS):
+        self.caminho = caminho
+        self._leitores = queue.LifoQueue(maxsize=max_leitores)
+        self._escritor = None
+        self._lock_escrita = threading.RLock()
+        self._profundidade_escrita = 0
+        self._tabelas_alteradas = set()
+        self._lock_stats = threading.Lock()
+        self._stats = {'aberturas': 0, 'fechamentos': 0, 'leituras': 0, 'escritas': 0}
+
+    def _contar(self, chave):
+        with self._lock_stats:
+            self._stats[chave] += 1
+
+    def _abrir(self):
+        """Abre e configura uma nova conexão"""
+        conn = sqlite3.connect(self.caminho, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMAS_CONEXAO:
+            conn.execute(pragma)
+        self._contar('aberturas')
+        return conn
+
+    def _fechar(self, conn):
+        conn.close()
+        self._contar('fechamentos')
+
+    @contextmanager
+    def leitura(self):
+        """Empresta uma conexão de leitura e devolve ao pool ao final"""
+        try:
+            conn = self._leitores.get_nowait()
+        except queue.Empty:
+            conn = self._abrir()
+        self._contar('leituras')
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._leitores.put_nowait(conn)
+            except queue.Full:
+                self._fechar(conn)
+
+    @contextmanager
+    def escrita(self, *tabelas):
+        """Conexão de escrita serializada; commit ao final ou rollback em erro.
+
+        Chamadas aninhadas na mesma thread participam da mesma transação.
+        Após o commit, o cache de consultas das `tabelas` informadas é invalidado
+        (sem tabelas informadas, o cache inteiro é descartado).
+        """
+        with self._lock_escrita:
+            if self._escritor is None:
+                self._escritor = self._abrir()
+            conn = self._escritor
+            self._profundidade_escrita += 1
+            self._tabelas_alteradas.update(tabelas)
+            externa = self._profundidade_escrita == 1
+            try:
+                if externa:
+                    self._contar('escritas')
+                    # Reserva o lock de escrita já no início: leituras feitas dentro
+                    # da transação (ex.: conferência de estoque) continuam válidas até o commit
+                    conn.execute('BEGIN IMMEDIATE')
+                yield conn
+                if externa:
+                    conn.commit()
+                    get_cache().invalidar(*self._tabelas_alteradas)
+            except Exception:
+                if externa:
+                    conn.rollback()
+                raise
+            finally:
+                self._profundidade_escrita -= 1
+                if externa:
+                    self._tabelas_alteradas.clear()
+
+    def aplicar_migracoes(self):
+        """Roda migrar() na conexão de escrita, com o lock de escrita mas fora de escrita():
+        cada migração abre e fecha a própria transação. Retorna a versão do schema."""
+        with self._lock_escrita:
+            if self._escritor is None:
+                self._escritor = self._abrir()
+            versao = migrar(self._escritor)
+        get_cache().invalidar()
+        return versao
+
+    def estatisticas(self):
+        """Contadores de abertura/fechamento e uso do pool"""
+        with self._lock_stats:
+            stats = dict(self._stats)
+        stats['abertas'] = stats['aberturas'] - stats['fechamentos']
+        stats['leitores_ociosos'] = self._leitores.qsize()
+        return stats
+
+    def fechar_todas(self):
+        """Fecha todas as conexões ociosas e o escritor"""
+        while True:
+            try:
+                self._fechar(self._leitores.get_nowait())
+            except queue.Empty:
+                break
+        with self._lock_escrita:
+            if self._escritor is not None:
+                self._fechar(self._escritor)
+                self._escritor = None
+
+
+# =========================================
+# ⚡ CACHE DE CONSULTAS
+# =========================================
+
+TTL_CACHE_PADRAO = 300  # segundos
+MAX_ENTRADAS_CACHE = 2000  # acima disso, gravar no cache descarta as entradas vencidas
+
+
+class CacheConsultas:
+    """Cache de resultados de leitura com TTL e invalidação por tabela.
+
+    Cada entrada registra as tabelas de que depende; uma escrita confirmada em
+    qualquer delas descarta a entrada. Um contador de versão por tabela evita
+    gravar no cache um resultado carregado antes de uma invalidação concorrente.
+    Chaves variáveis (termos de busca, páginas, períodos, dia) não se repetem, então
+    ao passar de `max_entradas` as vencidas são removidas e, se ainda faltar espaço,
+    as mais próximas de vencer.
+    """
+
+    def __init__(self, ttl=TTL_CACHE_PADRAO, max_entradas=MAX_ENTRADAS_CACHE):
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self._entradas = {}
+        self._versoes = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'invalidacoes': 0, 'expiradas': 0, 'descartadas': 0}
+
+    def obter(self, chave, tabelas, carregar, ttl=None):
+        """Retorna o valor em cache para `chave` ou chama `carregar()` e guarda o resultado"""
+        agora = time.monotonic()
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada and entrada[0] > agora:
+                self._stats['hits'] += 1
+                return entrada[2]
+            self._stats['misses'] += 1
+            versoes = tuple(self._versoes.get(t, 0) for t in tabelas)
+        
+        valor = carregar()
+        
+        with self._lock:
+            if versoes == tuple(self._versoes.get(t, 0) for t in tabelas):
+                if chave not in self._entradas and len(self._entradas) >= self.max_entradas:
+                    self._liberar_espaco(agora)
+                expira = agora + (self.ttl if ttl is None else ttl)
+                self._entradas[chave] = (expira, frozenset(tabelas), valor)
+        return valor
+    
+    def _liberar_espaco(self, agora):
+        """Remove as entradas vencidas; se não bastar, as que vencem primeiro (chamar com o lock)"""
+        vencidas = [c for c, e in self._entradas.items() if e[0] <= agora]
+        for chave in vencidas:
+            del self._entradas[chave]
+        self._stats['expiradas'] += len(vencidas)
+        
+        excesso = len(self._entradas) - self.max_entradas + 1
+        if excesso > 0:
+            for chave in heapq.nsmallest(excesso, self._entradas, key=lambda c: self._entradas[c][0]):
+                del self._entradas[chave]
+            self._stats['descartadas'] += excesso
+
+    def invalidar(self, *tabelas):
+        """Descarta entradas que dependem das tabelas; sem argumentos limpa tudo"""
+        with self._lock:
+            if not tabelas:
+                self._entradas.clear()
+                self._versoes = {t: v + 1 for t, v in self._versoes.items()}
+                self._stats['invalidacoes'] += 1
+                return
+            alvo = set(tabelas)
+            for tabela in alvo:
+                self._versoes[tabela] = self._versoes.get(tabela, 0) + 1
+            for chave in [c for c, e in self._entradas.items() if e[1] & alvo]:
+                del self._entradas[chave]
+            self._stats['invalidacoes'] += 1
+
+    def estatisticas(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entradas'] = len(self._entradas)
+        total = stats['hits'] + stats['misses']
+        stats['taxa_acerto'] = stats['hits'] / total if total else 0.0
+        return stats
+
+
+# =========================================
+# 📐 AGREGADOS MATERIALIZADOS
+# =========================================
+
+# Tabelas de resumo mantidas incrementalmente pelas escritas do app.
+# Aqui fica só o SQL de reconstrução completa (usado na migração e em reconstruir_agregados).
+AGREGADOS = {
+    # Vendas por dia e escola; pedidos cancelados não entram
+    'vendas_diarias': [
+        'DELETE FROM vendas_diarias',
+        '''
+        INSERT INTO vendas_diarias (data, escola_id, pedidos, itens, valor)
+        SELECT DATE(data_pedido), escola_id, COUNT(*), SUM(quantidade_total), SUM(valor_total)
+        FROM pedidos
+        WHERE status <> 'Cancelado'
+        GROUP BY DATE(data_pedido), escola_id
+        ''',
+    ],
+    # Contadores de venda por produto e escola (total e por dia, para janelas de datas)
+    'vendas_produtos': [
+        'DELETE FROM vendas_produtos',
+        'DELETE FROM vendas_produtos_diarias',
+        '''
+        INSERT INTO vendas_produtos_diarias (data, escola_id, produto_id, quantidade, valor)
+        SELECT DATE(p.data_pedido), p.escola_id, pi.produto_id, SUM(pi.quantidade), SUM(pi.subtotal)
+        FROM pedido_itens pi
+        JOIN pedidos p ON pi.pedido_id = p.id
+        WHERE p.status <> 'Cancelado'
+        GROUP BY DATE(p.data_pedido), p.escola_id, pi.produto_id
+        ''',
+        '''
+        INSERT INTO vendas_produtos (produto_id, escola_id, quantidade, valor)
+        SELECT produto_id, escola_id, SUM(quantidade), SUM(valor)
+        FROM vendas_produtos_diarias
+        GROUP BY produto_id, escola_id
+        ''',
+    ],
+}
+
+# =========================================
+# 🧱 MIGRAÇÕES DE SCHEMA
+# =========================================
+
+# Cada migração é (versão, [comandos SQL]); a versão aplicada fica em PRAGMA user_version.
+# Novas alterações de schema entram sempre no final da lista, com a próxima versão.
+MIGRACOES = [
+    (1, [
+        '''
+        CREATE TABLE IF NOT EXISTS usuarios (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            nome_completo TEXT,
+            tipo TEXT DEFAULT 'vendedor',
+            ativo BOOLEAN DEFAULT 1,
+            data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS escolas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT UNIQUE NOT NULL
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS clientes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL,
+            telefone TEXT,
+            email TEXT,
+            data_cadastro DATE DEFAULT CURRENT_DATE
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS produtos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL,
+            categoria TEXT,
+            tamanho TEXT,
+            cor TEXT,
+            preco REAL,
+            estoque INTEGER DEFAULT 0,
+            descricao TEXT,
+            escola_id INTEGER REFERENCES escolas(id),
+            data_cadastro TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS pedidos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cliente_id INTEGER REFERENCES clientes(id),
+            escola_id INTEGER REFERENCES escolas(id),
+            status TEXT DEFAULT 'Pendente',
+            data_pedido TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            data_entrega_prevista DATE,
+            data_entrega_real DATE,
+            forma_pagamento TEXT DEFAULT 'Dinheiro',
+            quantidade_total INTEGER,
+            valor_total REAL,
+            observacoes TEXT
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS pedido_itens (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            pedido_id INTEGER REFERENCES pedidos(id) ON DELETE CASCADE,
+            produto_id INTEGER REFERENCES produtos(id),
+            quantidade INTEGER,
+            preco_unitario REAL,
+            subtotal REAL
+        )
+        ''',
+    ]),
+    (2, [
+        # Índices para os filtros/joins mais usados
+        'CREATE INDEX IF NOT EXISTS idx_pedidos_escola_data ON pedidos(escola_id, data_pedido DESC)',
+        'CREATE INDEX IF NOT EXISTS idx_pedidos_cliente ON pedidos(cliente_id)',
+        'CREATE INDEX IF NOT EXISTS idx_pedido_itens_pedido ON pedido_itens(pedido_id)',
+        'CREATE INDEX IF NOT EXISTS idx_pedido_itens_produto ON pedido_itens(produto_id)',
+        'CREATE INDEX IF NOT EXISTS idx_produtos_escola_categoria_nome ON produtos(escola_id, categoria, nome)',
+    ]),
+    (3, [
+        # Paginação por (data_pedido, id) sem filtro de escola e com filtro de status
+        'CREATE INDEX IF NOT EXISTS idx_pedidos_data ON pedidos(data_pedido DESC)',
+        'CREATE INDEX IF NOT EXISTS idx_pedidos_status_data ON pedidos(status, data_pedido DESC)',
+    ]),
+    (4, [
+        # Livro de movimentações de estoque (somente inserção); produtos.estoque é o saldo atual
+        '''
+        CREATE TABLE IF NOT EXISTS estoque_movimentos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            produto_id INTEGER NOT NULL REFERENCES produtos(id),
+            quantidade INTEGER NOT NULL,
+            motivo TEXT NOT NULL,
+            pedido_id INTEGER,
+            usuario TEXT,
+            data_movimento TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_movimentos_produto_data ON estoque_movimentos(produto_id, data_movimento)',
+        # Fotografias periódicas do estoque: saldo em uma data = checkpoint + movimentos posteriores
+        '''
+        CREATE TABLE IF NOT EXISTS estoque_checkpoints (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            data_checkpoint TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+            ultimo_movimento_id INTEGER NOT NULL
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_checkpoints_data ON estoque_checkpoints(data_checkpoint)',
+        '''
+        CREATE TABLE IF NOT EXISTS estoque_checkpoint_itens (
+            checkpoint_id INTEGER NOT NULL REFERENCES estoque_checkpoints(id) ON DELETE CASCADE,
+            produto_id INTEGER NOT NULL,
+            estoque INTEGER NOT NULL,
+            PRIMARY KEY (checkpoint_id, produto_id)
+        ) WITHOUT ROWID
+        ''',
+        # Saldo existente vira o movimento inicial de cada produto
+        '''
+        INSERT INTO estoque_movimentos (produto_id, quantidade, motivo)
+        SELECT id, estoque, 'saldo_inicial' FROM produtos WHERE estoque <> 0
+        ''',
+    ]),
+    (5, [
+        '''
+        CREATE TABLE IF NOT EXISTS vendas_diarias (
+            data TEXT NOT NULL,
+            escola_id INTEGER NOT NULL,
+            pedidos INTEGER NOT NULL DEFAULT 0,
+            itens INTEGER NOT NULL DEFAULT 0,
+            valor REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (data, escola_id)
+        ) WITHOUT ROWID
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_vendas_diarias_escola_data ON vendas_diarias(escola_id, data)',
+        *AGREGADOS['vendas_diarias'],
+    ]),
+    (6, [
+        '''
+        CREATE TABLE IF NOT EXISTS vendas_produtos (
+            produto_id INTEGER NOT NULL,
+            escola_id INTEGER NOT NULL,
+            quantidade INTEGER NOT NULL DEFAULT 0,
+            valor REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (produto_id, escola_id)
+        ) WITHOUT ROWID
+        ''',
+        # Top-N resolvido pelo índice: ORDER BY quantidade DESC LIMIT n
+        'CREATE INDEX IF NOT EXISTS idx_vendas_produtos_quantidade ON vendas_produtos(quantidade DESC)',
+        'CREATE INDEX IF NOT EXISTS idx_vendas_produtos_escola_quantidade ON vendas_produtos(escola_id, quantidade DESC)',
+        '''
+        CREATE TABLE IF NOT EXISTS vendas_produtos_diarias (
+            data TEXT NOT NULL,
+            escola_id INTEGER NOT NULL,
+            produto_id INTEGER NOT NULL,
+            quantidade INTEGER NOT NULL DEFAULT 0,
+            valor REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (data, escola_id, produto_id)
+        ) WITHOUT ROWID
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_vendas_produtos_diarias_escola ON vendas_produtos_diarias(escola_id, data)',
+        *AGREGADOS['vendas_produtos'],
+    ]),
+    (7, [
+        'CREATE INDEX IF NOT EXISTS idx_pedidos_pagamento_data ON pedidos(forma_pagamento, data_pedido DESC)',
+    ]),
+    (8, [
+        # Busca de clientes: FTS5 sobre a própria tabela (external content), sem acentos e com prefixos
+        '''
+        CREATE VIRTUAL TABLE IF NOT EXISTS clientes_busca USING fts5(
+            nome, telefone, email,
+            content='clientes', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS clientes_busca_ai AFTER INSERT ON clientes BEGIN
+            INSERT INTO clientes_busca (rowid, nome, telefone, email)
+            VALUES (new.id, new.nome, new.telefone, new.email);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS clientes_busca_ad AFTER DELETE ON clientes BEGIN
+            INSERT INTO clientes_busca (clientes_busca, rowid, nome, telefone, email)
+            VALUES ('delete', old.id, old.nome, old.telefone, old.email);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS clientes_busca_au AFTER UPDATE ON clientes BEGIN
+            INSERT INTO clientes_busca (clientes_busca, rowid, nome, telefone, email)
+            VALUES ('delete', old.id, old.nome, old.telefone, old.email);
+            INSERT INTO clientes_busca (rowid, nome, telefone, email)
+            VALUES (new.id, new.nome, new.telefone, new.email);
+        END
+        ''',
+        "INSERT INTO clientes_busca (clientes_busca) VALUES ('rebuild')",
+        'CREATE INDEX IF NOT EXISTS idx_clientes_nome ON clientes(nome)',
+    ]),
+    (9, [
+        # Reservas: estoque = físico, reservado = pedidos em aberto, disponível = estoque - reservado
+        'ALTER TABLE produtos ADD COLUMN reservado INTEGER NOT NULL DEFAULT 0',
+        # Pedidos em aberto já tinham baixado o estoque: a quantidade volta ao físico como reserva
+        '''
+        UPDATE produtos SET reservado = COALESCE((
+            SELECT SUM(pi.quantidade)
+            FROM pedido_itens pi
+            JOIN pedidos p ON pi.pedido_id = p.id
+            WHERE pi.produto_id = produtos.id AND p.status NOT IN ('Entregue', 'Cancelado')
+        ), 0)
+        ''',
+        'UPDATE produtos SET estoque = estoque + reservado WHERE reservado <> 0',
+        '''
+        INSERT INTO estoque_movimentos (produto_id, quantidade, motivo)
+        SELECT id, reservado, 'migracao_reservas' FROM produtos WHERE reservado <> 0
+        ''',
+    ]),
+]
+
+
+def versao_schema(conn):
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def migrar(conn):
+    """Ativa WAL e aplica as migrações pendentes, cada uma em sua transação.
+
+    Não pode rodar dentro de conexao_escrita() (a troca do journal exige estar fora
+    de transação): use aplicar_migracoes(). Retorna a versão final do schema.
+    """
+    if conn.in_transaction:
+        raise sqlite3.ProgrammingError("migrar() precisa de uma conexão fora de transação; use aplicar_migracoes()")
+    conn.execute('PRAGMA journal_mode = WAL')
+    
+    versao = versao_schema(conn)
+    for numero, comandos in MIGRACOES:
+        if numero <= versao:
+            continue
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for sql in comandos:
+                conn.execute(sql)
+            conn.execute(f'PRAGMA user_version = {numero}')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        versao = numero
+    return versao
+
+
+_pool = None
+_cache = None
+_lock_pool = threading.Lock()
+
+
+def get_pool():
+    """Retorna o pool de conexões único do processo"""
+    global _pool
+    if _pool is None:
+        with _lock_pool:
+            if _pool is None:
+                _pool = PoolConexoes()
+    return _pool
+
+
+def get_cache():
+    """Retorna o cache de consultas único do processo"""
+    global _cache
+    if _cache is None:
+        with _lock_pool:
+            if _cache is None:
+                _cache = CacheConsultas()
+    return _cache
+
+
+def conexao_leitura():
+    """Context manager de conexão para consultas"""
+    return get_pool().leitura()
+
+
+def conexao_escrita(*tabelas):
+    """Context manager de conexão para escritas (transacional).
+
+    `tabelas` são as tabelas alteradas, cujas consultas em cache são invalidadas após o commit.
+    """
+    return get_pool().escrita(*tabelas)
+
+
+def aplicar_migracoes():
+    """Aplica as migrações pendentes pelo pool; retorna a versão do schema"""
+    return get_pool().aplicar_migracoes()
+
+
+def consulta_em_cache(chave, tabelas, carregar, ttl=None):
+    """Atalho para get_cache().obter()"""
+    return get_cache().obter(chave, tabelas, carregar, ttl)
+
+
+def invalidar_cache(*tabelas):
+    get_cache().invalidar(*tabelas)
+
+
+def reconstruir_agregados(*nomes):
+    """Recalcula do zero as tabelas de AGREGADOS (todas, se nenhum nome for passado).
+
+    Retorna {nome: linhas}.
+    """
+    nomes = nomes or tuple(AGREGADOS)
+    resultado = {}
+    with conexao_escrita(*nomes) as conn:
+        for nome in nomes:
+            for sql in AGREGADOS[nome]:
+                conn.execute(sql)
+            resultado[nome] = conn.execute(f'SELECT COUNT(*) FROM {nome}').fetchone()[0]
+    return resultado
+
+
+def acumular_vendas(cur, pedido_id, sinal):
+    """Soma (sinal=1) ou retira (sinal=-1) o pedido dos agregados de vendas, na transação do cursor.
+
+    Pedidos cancelados não contam: chame antes de cancelar/excluir e depois de criar/reativar.
+    """
+    cur.execute('''
+        INSERT INTO vendas_diarias (data, escola_id, pedidos, itens, valor)
+        SELECT DATE(data_pedido), escola_id, ?, ? * quantidade_total, ? * valor_total
+        FROM pedidos
+        WHERE id = ? AND status <> 'Cancelado'
+        ON CONFLICT(data, escola_id) DO UPDATE SET
+            pedidos = pedidos + excluded.pedidos,
+            itens = itens + excluded.itens,
+            valor = valor + excluded.valor
+    ''', (sinal, sinal, sinal, pedido_id))
+    cur.execute('''
+        INSERT INTO vendas_produtos_diarias (data, escola_id, produto_id, quantidade, valor)
+        SELECT DATE(p.data_pedido), p.escola_id, pi.produto_id, ? * SUM(pi.quantidade), ? * SUM(pi.subtotal)
+        FROM pedido_itens pi
+        JOIN pedidos p ON pi.pedido_id = p.id
+        WHERE p.id = ? AND p.status <> 'Cancelado'
+        GROUP BY pi.produto_id
+        ON CONFLICT(data, escola_id, produto_id) DO UPDATE SET
+            quantidade = quantidade + excluded.quantidade,
+            valor = valor + excluded.valor
+    ''', (sinal, sinal, pedido_id))
+    cur.execute('''
+        INSERT INTO vendas_produtos (produto_id, escola_id, quantidade, valor)
+        SELECT pi.produto_id, p.escola_id, ? * SUM(pi.quantidade), ? * SUM(pi.subtotal)
+        FROM pedido_itens pi
+        JOIN pedidos p ON pi.pedido_id = p.id
+        WHERE p.id = ? AND p.status <> 'Cancelado'
+        GROUP BY pi.produto_id
+        ON CONFLICT(produto_id, escola_id) DO UPDATE SET
+            quantidade = quantidade + excluded.quantidade,
+            valor = valor + excluded.valor
+    ''', (sinal, sinal, pedido_id))
+
+    if sinal < 0:
+        # Remove as linhas zeradas pelas chaves do próprio pedido
+        cur.execute('''
+            DELETE FROM vendas_diarias
+            WHERE pedidos <= 0
+              AND (data, escola_id) = (SELECT DATE(data_pedido), escola_id FROM pedidos WHERE id = ?)
+        ''', (pedido_id,))
+        cur.execute('''
+            DELETE FROM vendas_produtos_diarias
+            WHERE quantidade <= 0
+              AND (data, escola_id) = (SELECT DATE(data_pedido), escola_id FROM pedidos WHERE id = ?)
+              AND produto_id IN (SELECT produto_id FROM pedido_itens WHERE pedido_id = ?)
+        ''', (pedido_id, pedido_id))
+        cur.execute('''
+            DELETE FROM vendas_produtos
+            WHERE quantidade <= 0
+              AND escola_id = (SELECT escola_id FROM pedidos WHERE id = ?)
+              AND produto_id IN (SELECT produto_id FROM pedido_itens WHERE pedido_id = ?)
+        ''', (pedido_id, pedido_id))
+
+
+def top_produtos_vendidos(conn, escola_id=None, limite=10, data_inicio=None, data_fim=None):
+    """Produtos mais vendidos a partir dos contadores (limite=None traz todos).
+
+    Sem período, é um ORDER BY ... LIMIT sobre o índice de vendas_produtos; com
+    período, agrega só as linhas diárias da janela. Retorna linhas
+    (produto, categoria, tamanho, cor, escola, total_vendido, total_faturado).
+    """
+    params = []
+    if data_inicio or data_fim:
+        janela = []
+        if escola_id:
+            janela.append('escola_id = ?')
+            params.append(escola_id)
+        if data_inicio:
+            janela.append('data >= ?')
+            params.append(data_inicio.strftime('%Y-%m-%d'))
+        if data_fim:
+            janela.append('data <= ?')
+            params.append(data_fim.strftime('%Y-%m-%d'))
+        origem = f'''(
+            SELECT produto_id, escola_id, SUM(quantidade) as quantidade, SUM(valor) as valor
+            FROM vendas_produtos_diarias
+            WHERE {' AND '.join(janela)}
+            GROUP BY produto_id, escola_id
+        )'''
+        filtro_escola = ''
+    else:
+        origem = 'vendas_produtos'
+        filtro_escola = 'AND v.escola_id = ?' if escola_id else ''
+        if escola_id:
+            params.append(escola_id)
+
+    sql = f'''
+        SELECT pr.nome, pr.categoria, pr.tamanho, pr.cor, e.nome, v.quantidade, v.valor
+        FROM {origem} v
+        JOIN produtos pr ON v.produto_id = pr.id
+        JOIN escolas e ON v.escola_id = e.id
+        WHERE v.quantidade > 0 {filtro_escola}
+        ORDER BY v.quantidade DESC
+    '''
+    if limite:
+        sql += ' LIMIT ?'
+        params.append(limite)
+    return conn.execute(sql, params).fetchall()
+
+
+def estatisticas_conexoes():
+    return get_pool().estatisticas()
+
+
+def estatisticas_cache():
+    return get_cache().estatisticas()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manutenção do banco do Sistema de Fardamentos")
+    comandos = parser.add_subparsers(dest='comando', required=True)
+    comandos.add_parser('migrar', help="aplica as migrações pendentes")
+    reconstruir = comandos.add_parser('reconstruir', help="recalcula as tabelas de agregados")
+    reconstruir.add_argument('agregados', nargs='*', metavar='AGREGADO',
+                             help=f"um ou mais de: {', '.join(sorted(AGREGADOS))} (padrão: todos)")
+    args = parser.parse_args(argv)
+    desconhecidos = set(getattr(args, 'agregados', ())) - set(AGREGADOS)
+    if desconhecidos:
+        parser.error(f"agregado(s) desconhecido(s): {', '.join(sorted(desconhecidos))}")
+
+    versao = aplicar_migracoes()
+    if args.comando == 'migrar':
+        print(f"Schema na versão {versao}")
+    else:
+        for nome, linhas in reconstruir_agregados(*args.agregados).items():
+            print(f"{nome}: {linhas} linha(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,151 @@
+import argparse
+import csv
+import sys
+
+from database import conexao_leitura
+
+# =========================================
+# 📤 EXPORTAÇÃO EM STREAMING (CSV / PARQUET)
+# =========================================
+
+TAMANHO_LOTE_EXPORTACAO = 5000
+
+# Cada exportação: consulta (com {where} para o filtro de escola, na coluna_escola) e colunas (nome, tipo)
+EXPORTACOES = {
+    'pedidos': {
+        'titulo': 'Pedidos com itens',
+        'sql': '''
+            SELECT
+                p.id, p.data_pedido, e.nome, c.nome, p.status, p.forma_pagamento,
+                p.data_entrega_prevista, p.data_entrega_real,
+                pr.id, pr.nome, pr.categoria, pr.tamanho, pr.cor,
+                pi.quantidade, pi.preco_unitario, pi.subtotal, p.valor_total
+            FROM pedidos p
+            JOIN escolas e ON p.escola_id = e.id
+            JOIN clientes c ON p.cliente_id = c.id
+            JOIN pedido_itens pi ON pi.pedido_id = p.id
+            JOIN produtos pr ON pi.produto_id = pr.id
+            {where}
+            ORDER BY p.data_pedido, p.id
+        ''',
+        'colunas': [
+            ('pedido_id', 'int'), ('data_pedido', 'str'), ('escola', 'str'), ('cliente', 'str'),
+            ('status', 'str'), ('forma_pagamento', 'str'), ('entrega_prevista', 'str'),
+            ('entrega_real', 'str'), ('produto_id', 'int'), ('produto', 'str'), ('categoria', 'str'),
+            ('tamanho', 'str'), ('cor', 'str'), ('quantidade', 'int'), ('preco_unitario', 'float'),
+            ('subtotal', 'float'), ('valor_total_pedido', 'float')
+        ]
+    },
+    # Relatórios: mesmos agregados da tela (vendas_diarias / vendas_produtos, sem cancelados)
+    'vendas_por_escola': {
+        'titulo': 'Vendas por escola (diário)',
+        'sql': '''
+            SELECT v.data, e.nome, v.pedidos, v.itens, v.valor
+            FROM vendas_diarias v
+            JOIN escolas e ON v.escola_id = e.id
+            {where}
+            ORDER BY v.data, e.nome
+        ''',
+        'coluna_escola': 'v.escola_id',
+        'colunas': [
+            ('data', 'str'), ('escola', 'str'), ('total_pedidos', 'int'),
+            ('total_itens', 'int'), ('total_vendas', 'float')
+        ]
+    },
+    'produtos_mais_vendidos': {
+        'titulo': 'Produtos mais vendidos',
+        'sql': '''
+            SELECT
+                pr.id, pr.nome, pr.categoria, pr.tamanho, pr.cor, e.nome,
+                v.quantidade, v.valor
+            FROM vendas_produtos v
+            JOIN produtos pr ON v.produto_id = pr.id
+            JOIN escolas e ON v.escola_id = e.id
+            {where}
+            ORDER BY v.quantidade DESC
+        ''',
+        'coluna_escola': 'v.escola_id',
+        'colunas': [
+            ('produto_id', 'int'), ('produto', 'str'), ('categoria', 'str'), ('tamanho', 'str'),
+            ('cor', 'str'), ('escola', 'str'), ('total_vendido', 'int'), ('total_faturado', 'float')
+        ]
+    }
+}
+
+
+def iterar_lotes(tipo, escola_id=None, tamanho_lote=TAMANHO_LOTE_EXPORTACAO):
+    """Gera lotes de linhas (tuplas) direto do cursor, sem fetchall()"""
+    config = EXPORTACOES[tipo]
+    where = f"WHERE {config.get('coluna_escola', 'p.escola_id')} = ?" if escola_id else ""
+    params = (escola_id,) if escola_id else ()
+
+    with conexao_leitura() as conn:
+        cur = conn.cursor()
+        cur.execute(config['sql'].format(where=where), params)
+        while True:
+            lote = cur.fetchmany(tamanho_lote)
+            if not lote:
+                break
+            yield [tuple(linha) for linha in lote]
+
+
+def exportar_csv(tipo, destino, escola_id=None):
+    """Escreve a exportação em CSV no arquivo texto `destino`; retorna o nº de linhas"""
+    escritor = csv.writer(destino)
+    escritor.writerow([nome for nome, _ in EXPORTACOES[tipo]['colunas']])
+    total = 0
+    for lote in iterar_lotes(tipo, escola_id):
+        escritor.writerows(lote)
+        total += len(lote)
+    return total
+
+
+def exportar_parquet(tipo, destino, escola_id=None):
+    """Escreve a exportação em Parquet (um row group por lote); retorna o nº de linhas"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tipos = {'int': pa.int64(), 'float': pa.float64(), 'str': pa.string()}
+    colunas = EXPORTACOES[tipo]['colunas']
+    schema = pa.schema([(nome, tipos[t]) for nome, t in colunas])
+
+    total = 0
+    with pq.ParquetWriter(destino, schema) as escritor:
+        for lote in iterar_lotes(tipo, escola_id):
+            valores = list(zip(*lote))
+            tabela = pa.Table.from_arrays(
+                [pa.array(valores[i], type=schema.field(i).type) for i in range(len(colunas))],
+                schema=schema
+            )
+            escritor.write_table(tabela)
+            total += len(lote)
+        if total == 0:
+            escritor.write_table(schema.empty_table())
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta relatórios e histórico de pedidos do Sistema de Fardamentos")
+    parser.add_argument('tipo', choices=sorted(EXPORTACOES))
+    parser.add_argument('--formato', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--saida', help="arquivo de saída (padrão: <tipo>.<formato>; '-' = stdout, só CSV)")
+    parser.add_argument('--escola-id', type=int, help="filtra por escola")
+    args = parser.parse_args(argv)
+
+    saida = args.saida or f"{args.tipo}.{args.formato}"
+    if args.formato == 'parquet':
+        if saida == '-':
+            parser.error("Parquet não pode ser escrito em stdout")
+        total = exportar_parquet(args.tipo, saida, args.escola_id)
+    elif saida == '-':
+        total = exportar_csv(args.tipo, sys.stdout, args.escola_id)
+    else:
+        with open(saida, 'w', newline='', encoding='utf-8-sig') as arquivo:
+            total = exportar_csv(args.tipo, arquivo, args.escola_id)
+
+    print(f"{total} linha(s) exportada(s) para {saida}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import streamlit as st
+
+from servicos import adicionar_cliente, excluir_cliente, listar_clientes, listar_escolas
+from componentes import busca_cliente_ui, importacao_ui
+from registros import Cliente, para_dataframe
+
+# =========================================
+# 👥 PÁGINA: CLIENTES
+# =========================================
+
+def exibir():
+    tab1, tab2, tab3, tab4 = st.tabs(["➕ Cadastrar Cliente", "📋 Listar Clientes", "🗑️ Excluir Cliente", "📥 Importar Planilha"])
+    
+    with tab1:
+        st.header("➕ Novo Cliente")
+        
+        nome = st.text_input("👤 Nome completo*")
+        telefone = st.text_input("📞 Telefone")
+        email = st.text_input("📧 Email")
+        
+        if st.button("✅ Cadastrar Cliente", type="primary"):
+            if nome:
+                sucesso, msg = adicionar_cliente(nome, telefone, email)
+                if sucesso:
+                    st.success(msg)
+                    st.balloons()
+                else:
+                    st.error(msg)
+            else:
+                st.error("❌ Nome é obrigatório!")
+    
+    with tab2:
+        st.header("📋 Clientes Cadastrados")
+        clientes = listar_clientes()
+        
+        if clientes:
+            df_clientes = para_dataframe(clientes, Cliente).fillna({'telefone': 'N/A', 'email': 'N/A'})
+            df_clientes.columns = ['ID', 'Nome', 'Telefone', 'Email', 'Data Cadastro']
+            st.dataframe(df_clientes, use_container_width=True)
+        else:
+            st.info("👥 Nenhum cliente cadastrado")
+    
+    with tab3:
+        st.header("🗑️ Excluir Cliente")
+        cliente_id = busca_cliente_ui("excluir_cliente", "Buscar cliente para excluir:")
+        
+        if cliente_id:
+            st.warning("⚠️ Esta ação não pode ser desfeita!")
+            if st.button("🗑️ Confirmar Exclusão", type="primary"):
+                sucesso, msg = excluir_cliente(cliente_id)
+                if sucesso:
+                    st.success(msg)
+                    st.rerun()
+                else:
+                    st.error(msg)
+    
+    with tab4:
+        st.header("📥 Importar Clientes")
+        importacao_ui('clientes', listar_escolas())
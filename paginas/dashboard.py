@@ -0,0 +1,61 @@
+import streamlit as st
+
+from servicos import obter_metricas_dashboard
+
+# =========================================
+# 📊 PÁGINA: DASHBOARD
+# =========================================
+
+def exibir():
+    st.header("🎯 Métricas em Tempo Real")
+    
+    # Carregar dados (uma única consulta agregada)
+    metricas = obter_metricas_dashboard()
+    escolas = metricas['escolas']
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total de Pedidos", metricas['total_pedidos'])
+    
+    with col2:
+        st.metric("Pedidos Pendentes", metricas['pedidos_pendentes'])
+    
+    with col3:
+        st.metric("Clientes Ativos", metricas['total_clientes'])
+    
+    with col4:
+        produtos_repor = metricas['produtos_repor']
+        st.metric("No Ponto de Pedido", produtos_repor, delta=-produtos_repor)
+    
+    # Métricas por Escola
+    st.header("🏫 Métricas por Escola")
+    if escolas:
+        escolas_cols = st.columns(len(escolas))
+        
+        for idx, escola in enumerate(escolas):
+            with escolas_cols[idx]:
+                st.subheader(escola['nome'])
+                st.metric("Pedidos", escola['pedidos'])
+                st.metric("Pendentes", escola['pendentes'])
+                st.metric("Produtos", escola['produtos'])
+                st.metric("Ponto de Pedido", escola['repor'])
+    
+    # Ações Rápidas
+    st.header("⚡ Ações Rápidas")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("📝 Novo Pedido", use_container_width=True):
+            st.session_state.menu = "📦 Pedidos"
+            st.rerun()
+    
+    with col2:
+        if st.button("👥 Cadastrar Cliente", use_container_width=True):
+            st.session_state.menu = "👥 Clientes"
+            st.rerun()
+    
+    with col3:
+        if st.button("👕 Cadastrar Produto", use_container_width=True):
+            st.session_state.menu = "👕 Produtos"
+            st.rerun()
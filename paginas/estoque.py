@@ -0,0 +1,158 @@
+import streamlit as st
+import pandas as pd
+from datetime import date
+
+from servicos import (
+    listar_escolas, listar_produtos_por_escola, atualizar_estoque_em_lote, sugestao_reposicao_por_escola,
+    listar_movimentos_estoque, estoque_na_data
+)
+from componentes import grade_tamanhos_ui, importacao_ui
+from registros import Produto, para_dataframe
+from reposicao import JANELA_VENDAS_DIAS
+
+# =========================================
+# 📦 PÁGINA: ESTOQUE
+# =========================================
+
+def exibir():
+    escolas = listar_escolas()
+    
+    if not escolas:
+        st.error("❌ Nenhuma escola cadastrada. Configure as escolas primeiro.")
+        st.stop()
+    
+    with st.expander("📥 Importar Contagem de Estoque"):
+        importacao_ui('estoque', escolas)
+    
+    # Apenas a escola selecionada é renderizada
+    escola_estoque_nome = st.selectbox(
+        "🏫 Selecione a Escola:",
+        [e.nome for e in escolas],
+        key="estoque_escola"
+    )
+    escola = next(e for e in escolas if e.nome == escola_estoque_nome)
+    
+    st.header(f"📦 Controle de Estoque - {escola.nome}")
+    
+    produtos = listar_produtos_por_escola(escola.id)
+    
+    if produtos:
+        df_produtos = para_dataframe(produtos, Produto)
+        
+        # Reposição pelo ritmo de vendas (ponto de pedido), no lugar do limite fixo de estoque
+        reposicao = sugestao_reposicao_por_escola(escola.id)
+        
+        # Métricas da escola (alertas pelo disponível = estoque - reservado)
+        col1, col2, col3, col4 = st.columns(4)
+        total_produtos = len(df_produtos)
+        total_estoque = int(df_produtos['estoque'].sum())
+        produtos_repor = int(reposicao['repor'].sum()) if not reposicao.empty else 0
+        produtos_sem_estoque = int((df_produtos['estoque'] - df_produtos['reservado'] <= 0).sum())
+        
+        with col1:
+            st.metric("Total Produtos", total_produtos)
+        with col2:
+            st.metric("Estoque Total", total_estoque)
+        with col3:
+            st.metric("No Ponto de Pedido", produtos_repor)
+        with col4:
+            st.metric("Sem Disponível", produtos_sem_estoque)
+        
+        # Grade editável: todas as alterações são gravadas juntas
+        st.subheader("📋 Ajuste de Estoque")
+        visualizacao = st.radio("Visualização:", ["📋 Lista", "🔢 Grade por Tamanho"], horizontal=True,
+                                key="estoque_visualizacao")
+        
+        if visualizacao == "🔢 Grade por Tamanho":
+            grade_tamanhos_ui(escola.id, editavel=True)
+        
+        else:
+            df_estoque = pd.DataFrame({
+                'ID': df_produtos['id'],
+                'Produto': df_produtos['nome'],
+                'Categoria': df_produtos['categoria'],
+                'Tamanho': df_produtos['tamanho'],
+                'Cor': df_produtos['cor'],
+                'Preço': df_produtos['preco'],
+                'Estoque': df_produtos['estoque'],
+                'Reservado': df_produtos['reservado'],
+                'Disponível': df_produtos['estoque'] - df_produtos['reservado']
+            })
+        
+            editado = st.data_editor(
+                df_estoque,
+                column_config={
+                    'Preço': st.column_config.NumberColumn(format="R$ %.2f"),
+                    'Estoque': st.column_config.NumberColumn(min_value=0, step=1, required=True)
+                },
+                disabled=['ID', 'Produto', 'Categoria', 'Tamanho', 'Cor', 'Preço', 'Reservado', 'Disponível'],
+                hide_index=True,
+                use_container_width=True,
+                key=f"editor_estoque_{escola.id}"
+            )
+        
+            alterados = editado[editado['Estoque'].notna() & (editado['Estoque'] != df_estoque['Estoque'])]
+            if not alterados.empty:
+                st.info(f"✏️ {len(alterados)} alteração(ões) pendente(s)")
+                if st.button("💾 Salvar Alterações", type="primary", key=f"salvar_estoque_{escola.id}"):
+                    ajustes = [(int(pid), int(qtd)) for pid, qtd in zip(alterados['ID'], alterados['Estoque'])]
+                    sucesso, resultado = atualizar_estoque_em_lote(ajustes)
+                    if sucesso:
+                        st.success(f"✅ Estoque atualizado para {len(resultado)} produto(s)!")
+                        st.dataframe(
+                            pd.DataFrame(resultado, columns=['ID', 'Estoque Anterior', 'Novo Estoque', 'Diferença']),
+                            use_container_width=True,
+                            hide_index=True
+                        )
+                    else:
+                        st.error(resultado)
+        
+        if not reposicao.empty:
+            repor = reposicao[reposicao['repor']]
+            if not repor.empty:
+                st.subheader(f"🛒 Sugestão de Compra ({len(repor)} produto(s) no ponto de pedido)")
+                st.dataframe(
+                    repor[['nome', 'tamanho', 'cor', 'estoque', 'velocidade', 'dias_cobertura',
+                           'ponto_pedido', 'sugestao_compra']].rename(columns={
+                        'nome': 'Produto', 'tamanho': 'Tamanho', 'cor': 'Cor', 'estoque': 'Estoque',
+                        'velocidade': 'Vendas/dia', 'dias_cobertura': 'Dias de Cobertura',
+                        'ponto_pedido': 'Ponto de Pedido', 'sugestao_compra': 'Comprar'
+                    }),
+                    use_container_width=True,
+                    hide_index=True
+                )
+            
+            sem_giro = reposicao[(reposicao['velocidade'] == 0) & (reposicao['estoque'] == 0)]
+            if not sem_giro.empty:
+                st.caption(f"ℹ️ {len(sem_giro)} produto(s) sem estoque e sem vendas nos últimos "
+                           f"{JANELA_VENDAS_DIAS} dias não entram na sugestão")
+        
+        with st.expander("📜 Movimentações Recentes"):
+            movimentos = listar_movimentos_estoque(escola.id)
+            if not movimentos.empty:
+                st.dataframe(
+                    movimentos.rename(columns={
+                        'id': 'ID', 'data_movimento': 'Data', 'nome': 'Produto', 'tamanho': 'Tamanho', 'cor': 'Cor',
+                        'quantidade': 'Quantidade', 'motivo': 'Motivo', 'pedido_id': 'Pedido', 'usuario': 'Usuário'
+                    }),
+                    use_container_width=True,
+                    hide_index=True
+                )
+            else:
+                st.info("Nenhuma movimentação registrada")
+        
+        with st.expander("🕓 Estoque em uma Data"):
+            data_consulta = st.date_input("Data:", value=date.today(), max_value=date.today(), key="estoque_data")
+            saldo = estoque_na_data(escola.id, data_consulta)
+            if not saldo.empty:
+                st.dataframe(
+                    saldo.rename(columns={
+                        'id': 'ID', 'nome': 'Produto', 'categoria': 'Categoria', 'tamanho': 'Tamanho',
+                        'cor': 'Cor', 'estoque': 'Estoque'
+                    }),
+                    use_container_width=True,
+                    hide_index=True
+                )
+    
+    else:
+        st.info(f"👕 Nenhum produto cadastrado para {escola.nome}")
@@ -0,0 +1,330 @@
+import streamlit as st
+import pandas as pd
+from datetime import date
+
+from servicos import (
+    status_pedidos, formas_pagamento, listar_escolas, indice_produtos_por_escola, adicionar_pedido,
+    listar_pedidos_paginado, contar_pedidos, ids_pedidos_filtrados, obter_metricas_dashboard,
+    atualizar_status_pedido, atualizar_status_pedidos_em_lote, excluir_pedido
+)
+from componentes import busca_cliente_ui, filtros_pedidos_ui, pagina_pedidos_ui
+from catalogo import disponivel
+from registros import Pedido, para_dataframe
+
+# =========================================
+# 📦 PÁGINA: PEDIDOS
+# =========================================
+
+def exibir():
+    escolas = listar_escolas()
+    
+    if not escolas:
+        st.error("❌ Nenhuma escola cadastrada. Configure as escolas primeiro.")
+        st.stop()
+    
+    # Abas principais
+    tab1, tab2, tab3, tab4 = st.tabs(["➕ Novo Pedido", "📋 Todos os Pedidos", "🔄 Gerenciar Pedidos", "📊 Por Escola"])
+    
+    with tab1:
+        st.header("➕ Novo Pedido")
+        
+        # Seleção da escola para o pedido
+        escola_pedido_nome = st.selectbox(
+            "🏫 Escola do Pedido:",
+            [e.nome for e in escolas],
+            key="pedido_escola"
+        )
+        escola_pedido_id = next(e.id for e in escolas if e.nome == escola_pedido_nome)
+        
+        # Selecionar cliente
+        cliente_id = busca_cliente_ui("pedido", "Buscar cliente:")
+        
+        if cliente_id:
+            # Produtos da escola selecionada
+            indice = indice_produtos_por_escola(escola_pedido_id)
+            
+            if len(indice):
+                st.subheader(f"🛒 Produtos Disponíveis - {escola_pedido_nome}")
+                
+                # Seletor estruturado: categoria -> produto -> tamanho -> cor
+                col1, col2, col3, col4 = st.columns([2, 3, 1, 2])
+                with col1:
+                    categoria_item = st.selectbox("Categoria:", indice.opcoes(), key="pedido_categoria")
+                with col2:
+                    nome_item = st.selectbox("Produto:", indice.opcoes(categoria_item), key="pedido_produto")
+                with col3:
+                    tamanho_item = st.selectbox("Tamanho:", indice.opcoes(categoria_item, nome_item), key="pedido_tamanho")
+                with col4:
+                    cor_item = st.selectbox("Cor:", indice.opcoes(categoria_item, nome_item, tamanho_item), key="pedido_cor")
+                
+                candidatos = indice.produtos(categoria_item, nome_item, tamanho_item, cor_item)
+                if len(candidatos) > 1:
+                    # Cadastro duplicado com os mesmos atributos: escolher pelo id
+                    opcoes_variacao = {f"#{p.id} - Disponível: {disponivel(p)} - R$ {p.preco:.2f}": p.id for p in candidatos}
+                    variacao = st.selectbox("Variação:", list(opcoes_variacao), key="pedido_variacao")
+                    produto = indice.produto(opcoes_variacao[variacao])
+                else:
+                    produto = candidatos[0] if candidatos else None
+                
+                with st.expander(f"📊 Disponibilidade - {nome_item}"):
+                    cores, tamanhos, estoque_matriz = indice.matriz_disponibilidade(categoria_item, nome_item)
+                    st.dataframe(
+                        pd.DataFrame([[estoque_matriz.get((cor, tamanho)) for tamanho in tamanhos] for cor in cores],
+                                     index=cores, columns=tamanhos),
+                        use_container_width=True
+                    )
+                
+                col1, col2, col3 = st.columns([3, 1, 1])
+                with col1:
+                    if produto:
+                        st.info(f"**{produto.nome}** - Tamanho: {produto.tamanho} - Cor: {produto.cor} | "
+                                f"Disponível: {disponivel(produto)} (reservado: {produto.reservado}) | R$ {produto.preco:.2f}")
+                with col2:
+                    quantidade = st.number_input("Quantidade", min_value=1, value=1, key="qtd_pedido")
+                with col3:
+                    if st.button("➕ Adicionar Item", use_container_width=True, disabled=produto is None):
+                        if 'itens_pedido' not in st.session_state:
+                            st.session_state.itens_pedido = []
+                        
+                        produto_id = produto.id
+                        
+                        if quantidade > disponivel(produto):
+                            st.error("❌ Quantidade indisponível em estoque!")
+                        else:
+                            # Verificar se produto já está no pedido
+                            item_existente = next((i for i in st.session_state.itens_pedido if i['produto_id'] == produto_id), None)
+                            
+                            if item_existente:
+                                item_existente['quantidade'] += quantidade
+                                item_existente['subtotal'] = item_existente['quantidade'] * item_existente['preco_unitario']
+                            else:
+                                item = {
+                                    'produto_id': produto_id,
+                                    'nome': produto.nome,
+                                    'tamanho': produto.tamanho,
+                                    'cor': produto.cor,
+                                    'quantidade': quantidade,
+                                    'preco_unitario': float(produto.preco),
+                                    'subtotal': float(produto.preco) * quantidade
+                                }
+                                st.session_state.itens_pedido.append(item)
+                            
+                            st.success("✅ Item adicionado!")
+                            st.rerun()
+                
+                # Mostrar itens adicionados
+                if 'itens_pedido' in st.session_state and st.session_state.itens_pedido:
+                    st.subheader("📋 Itens do Pedido")
+                    total_pedido = sum(item['subtotal'] for item in st.session_state.itens_pedido)
+                    
+                    for i, item in enumerate(st.session_state.itens_pedido):
+                        col1, col2, col3, col4, col5 = st.columns([3,1,1,1,1])
+                        with col1:
+                            st.write(f"**{item['nome']}**")
+                            st.write(f"Tamanho: {item['tamanho']} | Cor: {item['cor']}")
+                        with col2:
+                            st.write(f"Qtd: {item['quantidade']}")
+                        with col3:
+                            st.write(f"R$ {item['preco_unitario']:.2f}")
+                        with col4:
+                            st.write(f"R$ {item['subtotal']:.2f}")
+                        with col5:
+                            if st.button("❌ Remover", key=f"del_{i}"):
+                                st.session_state.itens_pedido.pop(i)
+                                st.rerun()
+                    
+                    st.success(f"**💰 Total do Pedido: R$ {total_pedido:.2f}**")
+                    
+                    # Informações adicionais do pedido
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        data_entrega = st.date_input("📅 Data de Entrega Prevista", min_value=date.today())
+                        forma_pagamento = st.selectbox("💳 Forma de Pagamento", formas_pagamento)
+                    with col2:
+                        observacoes = st.text_area("📝 Observações")
+                    
+                    if st.button("✅ Finalizar Pedido", type="primary", use_container_width=True):
+                        if st.session_state.itens_pedido:
+                            sucesso, resultado = adicionar_pedido(
+                                cliente_id, 
+                                escola_pedido_id,
+                                st.session_state.itens_pedido, 
+                                data_entrega, 
+                                forma_pagamento,
+                                observacoes
+                            )
+                            if sucesso:
+                                st.success(f"✅ Pedido #{resultado} criado com sucesso para {escola_pedido_nome}!")
+                                st.balloons()
+                                del st.session_state.itens_pedido
+                                st.rerun()
+                            else:
+                                st.error(f"❌ Erro ao criar pedido: {resultado}")
+                        else:
+                            st.error("❌ Adicione pelo menos um item ao pedido!")
+                else:
+                    st.info("🛒 Adicione itens ao pedido usando o botão 'Adicionar Item'")
+            else:
+                st.error(f"❌ Nenhum produto cadastrado para {escola_pedido_nome}. Cadastre produtos primeiro.")
+    
+    with tab2:
+        st.header("📋 Todos os Pedidos")
+        filtros, limite = filtros_pedidos_ui("todos_pedidos", escolas)
+        pedidos = pagina_pedidos_ui("todos_pedidos", filtros, limite)
+        
+        if pedidos:
+            df_pedidos = para_dataframe(pedidos, Pedido)
+            rotulos_status = {
+                'Pendente': '🟡 Pendente',
+                'Em produção': '🟠 Em produção', 
+                'Pronto para entrega': '🔵 Pronto para entrega',
+                'Entregue': '🟢 Entregue',
+                'Cancelado': '🔴 Cancelado'
+            }
+            
+            df = pd.DataFrame({
+                'ID': df_pedidos['id'],
+                'Escola': df_pedidos['escola_nome'],
+                'Cliente': df_pedidos['cliente_nome'],
+                # Categórica: o rótulo é calculado uma vez por status, não por pedido
+                'Status': df_pedidos['status'].map(lambda status: rotulos_status.get(status, f'⚪ {status}')),
+                'Forma Pagamento': df_pedidos['forma_pagamento'],
+                'Data Pedido': df_pedidos['data_pedido'],
+                'Entrega Prevista': df_pedidos['data_entrega_prevista'],
+                'Entrega Real': df_pedidos['data_entrega_real'].fillna('Não entregue'),
+                'Quantidade': df_pedidos['quantidade_total'],
+                'Valor Total': df_pedidos['valor_total'],
+                'Observações': df_pedidos['observacoes'].fillna('').replace('', 'Nenhuma')
+            })
+            st.dataframe(df, use_container_width=True, hide_index=True,
+                         column_config={'Valor Total': st.column_config.NumberColumn(format="R$ %.2f")})
+        else:
+            st.info("📦 Nenhum pedido realizado")
+    
+    with tab3:
+        st.header("🔄 Gerenciar Pedidos")
+        
+        # Filtros (aplicados no SQL, uma página por vez)
+        filtros, limite = filtros_pedidos_ui("gerenciar_pedidos", escolas)
+        
+        with st.expander("⚡ Alterar Status em Lote"):
+            # Página atual (antes de uma eventual alteração) só para montar a seleção
+            pedidos_pagina, _ = listar_pedidos_paginado(
+                **filtros, apos=st.session_state.get("gerenciar_pedidos_cursores", [None])[-1], limite=limite
+            )
+            alcance = st.radio("Aplicar a:", ["Pedidos selecionados", "Todos os pedidos do filtro"],
+                               horizontal=True, key="lote_alcance")
+            if alcance == "Pedidos selecionados":
+                opcoes_lote = {f"#{p.id} - {p.cliente_nome} - {p.status}": p.id for p in pedidos_pagina}
+                selecionados = st.multiselect("Pedidos (página atual):", list(opcoes_lote), key="lote_pedidos")
+                ids_lote = [opcoes_lote[o] for o in selecionados]
+            else:
+                ids_lote = None
+                st.caption(f"{contar_pedidos(**filtros)} pedido(s) atendem aos filtros atuais")
+            
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                status_lote = st.selectbox("Novo status:", status_pedidos, key="lote_status")
+            with col2:
+                aplicar = st.button("⚡ Aplicar", type="primary", key="lote_aplicar", use_container_width=True)
+            
+            if aplicar:
+                if ids_lote is None:
+                    ids_lote = ids_pedidos_filtrados(**filtros)
+                sucesso, resultado = atualizar_status_pedidos_em_lote(ids_lote, status_lote)
+                if sucesso:
+                    st.success(f"✅ {resultado['alterados']} pedido(s) alterado(s) para {status_lote}")
+                    if resultado['recusados']:
+                        st.warning(f"⚠️ {len(resultado['recusados'])} pedido(s) não podem ir para {status_lote}: " +
+                                   ", ".join(f"#{pid} ({status})" for pid, status in resultado['recusados'][:20]))
+                    if resultado['sem_estoque']:
+                        st.warning(f"⚠️ {len(resultado['sem_estoque'])} pedido(s) sem estoque para reservar ou entregar: " +
+                                   ", ".join(f"#{pid}" for pid in resultado['sem_estoque'][:20]))
+                else:
+                    st.error(resultado)
+        
+        pedidos = pagina_pedidos_ui("gerenciar_pedidos", filtros, limite)
+        
+        if pedidos:
+            for pedido in pedidos:
+                with st.expander(f"Pedido #{pedido.id} - {pedido.cliente_nome} - {pedido.escola_nome} - R$ {float(pedido.valor_total):.2f}"):
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.write(f"**Cliente:** {pedido.cliente_nome}")
+                        st.write(f"**Escola:** {pedido.escola_nome}")
+                        st.write(f"**Data do Pedido:** {pedido.data_pedido}")
+                        st.write(f"**Entrega Prevista:** {pedido.data_entrega_prevista}")
+                        if pedido.data_entrega_real:
+                            st.write(f"**Entrega Real:** {pedido.data_entrega_real}")
+                    
+                    with col2:
+                        st.write(f"**Status:** {pedido.status}")
+                        st.write(f"**Forma de Pagamento:** {pedido.forma_pagamento}")
+                        st.write(f"**Quantidade Total:** {pedido.quantidade_total}")
+                        st.write(f"**Valor Total:** R$ {float(pedido.valor_total):.2f}")
+                        if pedido.observacoes:
+                            st.write(f"**Observações:** {pedido.observacoes}")
+                    
+                    # Atualizar status
+                    col1, col2 = st.columns([2, 1])
+                    with col1:
+                        novo_status = st.selectbox(
+                            "Alterar status:",
+                            status_pedidos,
+                            key=f"status_{pedido.id}"
+                        )
+                    with col2:
+                        if st.button("🔄 Atualizar", key=f"upd_{pedido.id}"):
+                            if novo_status != pedido.status:
+                                sucesso, msg = atualizar_status_pedido(pedido.id, novo_status)
+                                if sucesso:
+                                    st.success(msg)
+                                    st.rerun()
+                                else:
+                                    st.error(msg)
+                    
+                    # Excluir pedido
+                    if st.button("🗑️ Excluir Pedido", key=f"del_{pedido.id}"):
+                        st.warning("⚠️ Esta ação não pode ser desfeita e restaurará o estoque!")
+                        if st.button("✅ Confirmar Exclusão", key=f"conf_del_{pedido.id}"):
+                            sucesso, msg = excluir_pedido(pedido.id)
+                            if sucesso:
+                                st.success(msg)
+                                st.rerun()
+                            else:
+                                st.error(msg)
+        else:
+            st.info("📦 Nenhum pedido para gerenciar")
+    
+    with tab4:
+        st.header("📊 Pedidos por Escola")
+        
+        # Contadores agregados (uma consulta para todas as escolas) e só uma página
+        # de pedidos por escola: cada rerun não carrega o histórico inteiro
+        metricas_escolas = {m['id']: m for m in obter_metricas_dashboard()['escolas']}
+        for escola in escolas:
+            with st.expander(f"🏫 {escola.nome}"):
+                metricas = metricas_escolas.get(escola.id)
+                
+                if metricas and metricas['pedidos']:
+                    # Métricas da escola
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("Total Pedidos", metricas['pedidos'])
+                    with col2:
+                        st.metric("Pedidos Pendentes", metricas['pendentes'])
+                    with col3:
+                        st.metric("Total Vendas", f"R$ {float(metricas['vendas']):.2f}")
+                    with col4:
+                        st.metric("Pedidos Entregues", metricas['entregues'])
+                    
+                    # Tabela resumida, paginada
+                    pedidos_escola = pagina_pedidos_ui(f"por_escola_{escola.id}", {'escola_id': escola.id}, 20)
+                    df_pedidos = para_dataframe(pedidos_escola, Pedido)
+                    resumo_pedidos = df_pedidos[['id', 'cliente_nome', 'status', 'data_pedido', 'valor_total']]
+                    resumo_pedidos.columns = ['ID', 'Cliente', 'Status', 'Data', 'Valor']
+                    st.dataframe(resumo_pedidos, use_container_width=True,
+                                 column_config={'Valor': st.column_config.NumberColumn(format="R$ %.2f")})
+                else:
+                    st.info(f"📦 Nenhum pedido para {escola.nome}")
@@ -0,0 +1,121 @@
+import streamlit as st
+import pandas as pd
+
+from servicos import (
+    todos_tamanhos, categorias_produtos, adicionar_produto, listar_escolas, listar_produtos_por_escola,
+    sugestao_reposicao_por_escola
+)
+from componentes import grade_tamanhos_ui, importacao_ui
+from registros import Produto, para_dataframe
+
+# =========================================
+# 👕 PÁGINA: PRODUTOS
+# =========================================
+
+def exibir():
+    escolas = listar_escolas()
+    
+    if not escolas:
+        st.error("❌ Nenhuma escola cadastrada. Configure as escolas primeiro.")
+        st.stop()
+    
+    # Seleção da escola
+    escola_selecionada_nome = st.selectbox(
+        "🏫 Selecione a Escola:",
+        [e.nome for e in escolas],
+        key="produtos_escola"
+    )
+    
+    escola_id = next(e.id for e in escolas if e.nome == escola_selecionada_nome)
+    
+    tab1, tab2, tab3 = st.tabs(["➕ Cadastrar Produto", "📋 Produtos da Escola", "📥 Importar Planilha"])
+    
+    with tab1:
+        st.header(f"➕ Novo Produto - {escola_selecionada_nome}")
+        
+        with st.form("novo_produto", clear_on_submit=True):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                nome = st.text_input("📝 Nome do produto*", placeholder="Ex: Camiseta Básica")
+                categoria = st.selectbox("📂 Categoria*", categorias_produtos)
+                tamanho = st.selectbox("📏 Tamanho*", todos_tamanhos)
+                cor = st.text_input("🎨 Cor*", value="Branco", placeholder="Ex: Azul Marinho")
+            
+            with col2:
+                preco = st.number_input("💰 Preço (R$)*", min_value=0.0, value=29.90, step=0.01)
+                estoque = st.number_input("📦 Estoque inicial*", min_value=0, value=10)
+                descricao = st.text_area("📄 Descrição", placeholder="Detalhes do produto...")
+            
+            if st.form_submit_button("✅ Cadastrar Produto", type="primary"):
+                if nome and cor:
+                    sucesso, msg = adicionar_produto(nome, categoria, tamanho, cor, preco, estoque, descricao, escola_id)
+                    if sucesso:
+                        st.success(msg)
+                        st.balloons()
+                    else:
+                        st.error(msg)
+                else:
+                    st.error("❌ Campos obrigatórios: Nome e Cor")
+    
+    with tab2:
+        st.header(f"📋 Produtos - {escola_selecionada_nome}")
+        produtos = listar_produtos_por_escola(escola_id)
+        
+        if produtos:
+            df_produtos = para_dataframe(produtos, Produto)
+            
+            # Alertas pelo ponto de pedido (ritmo de vendas) e pelo disponível, como na tela de Estoque
+            reposicao = sugestao_reposicao_por_escola(escola_id)
+            ids_repor = set(reposicao.loc[reposicao['repor'], 'id']) if not reposicao.empty else set()
+            disponivel = df_produtos['estoque'] - df_produtos['reservado']
+            
+            # Métricas rápidas
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                total_produtos = len(df_produtos)
+                st.metric("Total de Produtos", total_produtos)
+            with col2:
+                total_estoque = int(df_produtos['estoque'].sum())
+                st.metric("Estoque Total", total_estoque)
+            with col3:
+                st.metric("Produtos para Repor", len(ids_repor))
+            
+            visualizacao = st.radio("Visualização:", ["📋 Lista", "🔢 Grade por Tamanho"], horizontal=True,
+                                    key="produtos_visualizacao")
+            if visualizacao == "🔢 Grade por Tamanho":
+                grade_tamanhos_ui(escola_id)
+            else:
+                # Tabela de produtos
+                status_estoque = pd.Series("✅", index=df_produtos.index)
+                status_estoque[df_produtos['id'].isin(ids_repor)] = "⚠️"
+                status_estoque[disponivel <= 0] = "❌"
+                df = pd.DataFrame({
+                    'ID': df_produtos['id'],
+                    'Produto': df_produtos['nome'],
+                    'Categoria': df_produtos['categoria'],
+                    'Tamanho': df_produtos['tamanho'],
+                    'Cor': df_produtos['cor'],
+                    'Preço': df_produtos['preco'],
+                    'Estoque': status_estoque.astype(str) + " " + df_produtos['estoque'].astype(str),
+                    'Descrição': df_produtos['descricao'].fillna('N/A')
+                })
+                st.dataframe(df, use_container_width=True, hide_index=True,
+                             column_config={'Preço': st.column_config.NumberColumn(format="R$ %.2f")})
+            
+            # Estatísticas por categoria
+            st.subheader("📊 Estatísticas por Categoria")
+            resumo_categorias = df_produtos.groupby('categoria', observed=True).agg({
+                'estoque': ['count', 'sum']
+            }).round(0)
+            resumo_categorias.index.name = 'Categoria'
+            resumo_categorias.columns = ['Qtd Produtos', 'Total Estoque']
+            st.dataframe(resumo_categorias, use_container_width=True)
+            
+        else:
+            st.info(f"👕 Nenhum produto cadastrado para {escola_selecionada_nome}")
+    
+    with tab3:
+        st.header("📥 Importar Produtos")
+        st.info("A coluna 'escola' de cada linha define a escola do produto.")
+        importacao_ui('produtos', escolas)
@@ -0,0 +1,180 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from datetime import date
+import io
+import tempfile
+
+from servicos import (
+    listar_escolas, obter_metricas_dashboard, gerar_relatorio_vendas_por_escola,
+    gerar_relatorio_produtos_por_escola
+)
+from componentes import filtros_relatorio_ui
+from exportacao import EXPORTACOES, exportar_csv, exportar_parquet
+
+# =========================================
+# 📈 PÁGINA: RELATÓRIOS
+# =========================================
+
+def exibir():
+    escolas = listar_escolas()
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 Vendas por Escola", "📦 Produtos Mais Vendidos", "👥 Análise Completa", "📤 Exportar"])
+    
+    with tab1:
+        st.header("📊 Relatório de Vendas por Escola")
+        
+        escola_relatorio = st.selectbox(
+            "Selecione a escola:",
+            ["Todas as escolas"] + [e.nome for e in escolas],
+            key="relatorio_escola"
+        )
+        filtros_vendas = filtros_relatorio_ui("relatorio_vendas")
+        
+        escola_id = None
+        if escola_relatorio != "Todas as escolas":
+            escola_id = next(e.id for e in escolas if e.nome == escola_relatorio)
+        relatorio_vendas, resumo_vendas = gerar_relatorio_vendas_por_escola(escola_id, **filtros_vendas)
+        
+        if not relatorio_vendas.empty:
+            st.dataframe(relatorio_vendas, use_container_width=True)
+            
+            # Gráfico de vendas
+            if escola_relatorio == "Todas as escolas":
+                fig = px.line(relatorio_vendas, x='Data', y='Total Vendas (R$)', color='Escola',
+                             title='Evolução das Vendas por Escola')
+            else:
+                fig = px.line(relatorio_vendas, x='Data', y='Total Vendas (R$)', 
+                             title=f'Evolução das Vendas - {escola_relatorio}')
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Métricas resumidas
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Período", f"R$ {resumo_vendas['total']:.2f}")
+            with col2:
+                st.metric("Média Diária", f"R$ {resumo_vendas['media']:.2f}")
+            with col3:
+                st.metric("Maior Venda", f"R$ {resumo_vendas['maior']:.2f}")
+        else:
+            st.info("📊 Nenhum dado de venda disponível")
+    
+    with tab2:
+        st.header("📦 Produtos Mais Vendidos")
+        
+        escola_produtos = st.selectbox(
+            "Selecione a escola:",
+            ["Todas as escolas"] + [e.nome for e in escolas],
+            key="produtos_relatorio"
+        )
+        
+        top_n = st.selectbox("Exibir:", ["Top 10", "Top 25", "Top 50", "Top 100"], key="produtos_relatorio_limite")
+        limite_produtos = int(top_n.split()[1])
+        filtros_produtos = filtros_relatorio_ui("produtos_relatorio")
+        
+        escola_id = None
+        if escola_produtos != "Todas as escolas":
+            escola_id = next(e.id for e in escolas if e.nome == escola_produtos)
+        relatorio_produtos = gerar_relatorio_produtos_por_escola(escola_id, limite_produtos, **filtros_produtos)
+        
+        if not relatorio_produtos.empty:
+            st.dataframe(relatorio_produtos, use_container_width=True)
+            
+            # Gráfico de produtos mais vendidos
+            top_produtos = relatorio_produtos.head(10)
+            if escola_produtos == "Todas as escolas":
+                fig = px.bar(top_produtos, x='Produto', y='Total Vendido', color='Escola',
+                            title='Top 10 Produtos Mais Vendidos')
+            else:
+                fig = px.bar(top_produtos, x='Produto', y='Total Vendido',
+                            title=f'Top 10 Produtos Mais Vendidos - {escola_produtos}')
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("📦 Nenhum dado de produto vendido disponível")
+    
+    with tab3:
+        st.header("👥 Análise Completa do Sistema")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.subheader("🏫 Escolas")
+            escolas_count = len(escolas)
+            st.metric("Total de Escolas", escolas_count)
+            
+        metricas = obter_metricas_dashboard()
+        
+        with col2:
+            st.subheader("👥 Clientes")
+            st.metric("Total de Clientes", metricas['total_clientes'])
+            
+        with col3:
+            st.subheader("👕 Produtos")
+            st.metric("Total de Produtos", metricas['total_produtos'])
+        
+        # Resumo por escola
+        st.subheader("📋 Resumo por Escola")
+        resumo_data = []
+        for escola in metricas['escolas']:
+            resumo_data.append({
+                'Escola': escola['nome'],
+                'Produtos': escola['produtos'],
+                'Pedidos': escola['pedidos'],
+                'Vendas (R$)': float(escola['vendas'])
+            })
+        
+        if resumo_data:
+            st.dataframe(pd.DataFrame(resumo_data), use_container_width=True)
+            
+            # Gráfico de comparação entre escolas
+            fig = px.bar(pd.DataFrame(resumo_data), x='Escola', y='Vendas (R$)',
+                        title='Comparação de Vendas por Escola')
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with tab4:
+        st.header("📤 Exportar Dados")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            titulo_exportacao = st.selectbox(
+                "O que exportar:",
+                [config['titulo'] for config in EXPORTACOES.values()],
+                key="exportar_tipo"
+            )
+            tipo_exportacao = next(t for t, config in EXPORTACOES.items() if config['titulo'] == titulo_exportacao)
+        with col2:
+            escola_exportacao = st.selectbox(
+                "Escola:",
+                ["Todas as escolas"] + [e.nome for e in escolas],
+                key="exportar_escola"
+            )
+        with col3:
+            formato_exportacao = st.selectbox("Formato:", ["csv", "parquet"], key="exportar_formato")
+        
+        escola_id = next((e.id for e in escolas if e.nome == escola_exportacao), None)
+        
+        # O arquivo é gerado em streaming num temporário só quando solicitado
+        if st.button("⚙️ Gerar Arquivo", key="exportar_gerar"):
+            try:
+                with tempfile.TemporaryFile() as temporario:
+                    if formato_exportacao == 'csv':
+                        texto = io.TextIOWrapper(temporario, encoding='utf-8-sig', newline='')
+                        total = exportar_csv(tipo_exportacao, texto, escola_id)
+                        texto.flush()
+                        texto.detach()
+                    else:
+                        total = exportar_parquet(tipo_exportacao, temporario, escola_id)
+                    temporario.seek(0)
+                    
+                    st.success(f"✅ {total} linha(s) exportada(s)")
+                    st.download_button(
+                        "📥 Baixar Arquivo",
+                        data=temporario.read(),
+                        file_name=f"{tipo_exportacao}_{date.today():%Y%m%d}.{formato_exportacao}",
+                        mime="text/csv" if formato_exportacao == 'csv' else "application/octet-stream",
+                        key="exportar_baixar"
+                    )
+            except Exception as e:
+                st.error(f"❌ Erro ao exportar: {str(e)}")
+        
+        st.caption("Também disponível por linha de comando: `python exportacao.py pedidos --formato parquet --saida pedidos.parquet`")
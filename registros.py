@@ -0,0 +1,64 @@
+from collections import namedtuple
+
+import pandas as pd
+
+# =========================================
+# 🧾 REGISTROS NOMEADOS E RESULTADOS EM COLUNAS
+# =========================================
+
+# Tuplas com campos nomeados (sem __dict__ por linha); a ordem dos campos é a
+# ordem das colunas no SELECT, gerada por colunas_sql — nunca `SELECT *`.
+Escola = namedtuple('Escola', 'id nome')
+Usuario = namedtuple('Usuario', 'id username nome_completo tipo ativo data_criacao')
+Cliente = namedtuple('Cliente', 'id nome telefone email data_cadastro')
+Produto = namedtuple('Produto', 'id nome categoria tamanho cor preco estoque reservado descricao escola_id escola_nome')
+Pedido = namedtuple('Pedido', 'id cliente_id escola_id status data_pedido data_entrega_prevista data_entrega_real '
+                              'forma_pagamento quantidade_total valor_total observacoes cliente_nome escola_nome')
+
+# dtypes usados ao converter registros em DataFrame
+TIPOS_COLUNAS = {
+    Escola: {'id': 'int32'},
+    Cliente: {'id': 'int32'},
+    Produto: {
+        'id': 'int32', 'categoria': 'category', 'tamanho': 'category', 'cor': 'category',
+        'preco': 'float64', 'estoque': 'int32', 'reservado': 'int32', 'escola_id': 'Int32',
+        'escola_nome': 'category'
+    },
+    Pedido: {
+        'id': 'int32', 'cliente_id': 'int32', 'escola_id': 'int32', 'status': 'category',
+        'forma_pagamento': 'category', 'quantidade_total': 'Int32', 'valor_total': 'float64',
+        'escola_nome': 'category'
+    },
+}
+
+
+def colunas_sql(registro, alias, **expressoes):
+    """Colunas do SELECT na ordem dos campos do registro (`alias.campo`, ou a expressão dada)"""
+    return ", ".join(expressoes.get(campo, f"{alias}.{campo}") for campo in registro._fields)
+
+
+def ler_registros(conn, registro, sql, params=()):
+    """Executa a consulta e devolve uma lista de registros (sem sqlite3.Row intermediário)"""
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(sql, params)
+    return list(map(registro._make, cur.fetchall()))
+
+
+def _montar_dataframe(nomes, linhas, tipos):
+    df = pd.DataFrame(dict(zip(nomes, zip(*linhas)))) if linhas else pd.DataFrame(columns=nomes)
+    return df.astype({nome: tipo for nome, tipo in tipos.items() if nome in df.columns})
+
+
+def para_dataframe(registros, registro):
+    """DataFrame coluna a coluna a partir de registros, com os dtypes de TIPOS_COLUNAS"""
+    return _montar_dataframe(registro._fields, registros, TIPOS_COLUNAS.get(registro, {}))
+
+
+def ler_dataframe(conn, sql, params=(), tipos=None):
+    """Executa a consulta e monta o DataFrame direto das colunas do cursor"""
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(sql, params)
+    nomes = [coluna[0] for coluna in cur.description]
+    return _montar_dataframe(nomes, cur.fetchall(), tipos or {})
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+# =========================================
+# 🛒 PONTO DE PEDIDO E SUGESTÃO DE COMPRA
+# =========================================
+
+JANELA_VENDAS_DIAS = 60      # histórico usado para a velocidade de venda
+PRAZO_REPOSICAO_DIAS = 14    # tempo entre o pedido ao fornecedor e a chegada
+COBERTURA_ALVO_DIAS = 30     # estoque que a compra deve garantir após a chegada
+FATOR_SEGURANCA = 1.65       # ~95% de nível de serviço (distribuição normal)
+
+
+def calcular_reposicao(produtos, vendas, hoje, janela_dias=JANELA_VENDAS_DIAS,
+                       prazo_dias=PRAZO_REPOSICAO_DIAS, cobertura_dias=COBERTURA_ALVO_DIAS,
+                       fator_seguranca=FATOR_SEGURANCA):
+    """Velocidade, dias de cobertura, ponto de pedido e sugestão de compra de todos os produtos de uma vez.
+
+    `produtos`: DataFrame com id, nome, categoria, tamanho, cor, estoque.
+    `vendas`: DataFrame com produto_id, data ('YYYY-MM-DD'), quantidade — vendas diárias da janela.
+    Retorna `produtos` com as colunas calculadas, ordenado pela urgência (menor cobertura primeiro).
+    """
+    dias = pd.date_range(end=pd.Timestamp(hoje), periods=janela_dias, freq='D')
+
+    # Matriz produto x dia (dias sem venda = 0), para média e desvio por produto
+    demanda = np.zeros((len(produtos), janela_dias))
+    if not vendas.empty:
+        linha = pd.Index(produtos['id']).get_indexer(vendas['produto_id'])
+        coluna = dias.get_indexer(pd.to_datetime(vendas['data']))
+        validos = (linha >= 0) & (coluna >= 0)
+        np.add.at(demanda, (linha[validos], coluna[validos]), vendas['quantidade'].to_numpy()[validos])
+
+    velocidade = demanda.mean(axis=1)
+    desvio = demanda.std(axis=1)
+    estoque = produtos['estoque'].to_numpy(dtype=float)
+
+    estoque_seguranca = fator_seguranca * desvio * np.sqrt(prazo_dias)
+    ponto_pedido = velocidade * prazo_dias + estoque_seguranca
+    alvo = velocidade * (prazo_dias + cobertura_dias) + estoque_seguranca
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cobertura = np.where(velocidade > 0, estoque / velocidade, np.inf)
+
+    resultado = produtos.assign(
+        velocidade=velocidade.round(2),
+        dias_cobertura=np.round(cobertura, 1),
+        ponto_pedido=np.ceil(ponto_pedido).astype(int),
+        repor=(velocidade > 0) & (estoque <= ponto_pedido),
+        sugestao_compra=np.where(estoque <= ponto_pedido, np.ceil(np.maximum(alvo - estoque, 0)), 0).astype(int)
+    )
+    return resultado.sort_values(['repor', 'dias_cobertura', 'velocidade'], ascending=[False, True, False])
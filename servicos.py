@@ -0,0 +1,1213 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime, date, timedelta
+import re
+import io
+import csv
+import itertools
+import sqlite3
+
+from database import (
+    conexao_leitura, conexao_escrita, consulta_em_cache, acumular_vendas, top_produtos_vendidos
+)
+from catalogo import IndiceProdutos
+from registros import Escola, Cliente, Produto, Pedido, colunas_sql, ler_registros, ler_dataframe
+from reposicao import calcular_reposicao, JANELA_VENDAS_DIAS
+
+# =========================================
+# ⚙️ CONFIGURAÇÕES ESPECÍFICAS
+# =========================================
+
+tamanhos_infantil = ["2", "4", "6", "8", "10", "12"]
+tamanhos_adulto = ["PP", "P", "M", "G", "GG"]
+todos_tamanhos = tamanhos_infantil + tamanhos_adulto
+
+categorias_produtos = ["Camisetas", "Calças/Shorts", "Agasalhos", "Acessórios", "Outros"]
+
+status_pedidos = ["Pendente", "Em produção", "Pronto para entrega", "Entregue", "Cancelado"]
+formas_pagamento = ["Dinheiro", "Cartão de Crédito", "Cartão de Débito", "PIX", "Transferência"]
+
+# =========================================
+# 🔧 FUNÇÕES DO BANCO DE DADOS - SQLITE
+# =========================================
+
+# FUNÇÕES PARA ESCOLAS
+def listar_escolas():
+    def carregar():
+        with conexao_leitura() as conn:
+            return ler_registros(conn, Escola, f"SELECT {colunas_sql(Escola, 'e')} FROM escolas e ORDER BY e.nome")
+    
+    try:
+        return consulta_em_cache(('listar_escolas',), ('escolas',), carregar)
+    except Exception as e:
+        st.error(f"Erro ao listar escolas: {e}")
+        return []
+
+def obter_escola_por_id(escola_id):
+    try:
+        with conexao_leitura() as conn:
+            escolas = ler_registros(conn, Escola, f"SELECT {colunas_sql(Escola, 'e')} FROM escolas e WHERE e.id = ?",
+                                    (escola_id,))
+            return escolas[0] if escolas else None
+    except Exception as e:
+        st.error(f"Erro ao obter escola: {e}")
+        return None
+
+# FUNÇÕES PARA CLIENTES
+def adicionar_cliente(nome, telefone, email):
+    try:
+        with conexao_escrita('clientes') as conn:
+            cur = conn.cursor()
+            data_cadastro = datetime.now().strftime("%Y-%m-%d")
+            
+            cur.execute(
+                "INSERT INTO clientes (nome, telefone, email, data_cadastro) VALUES (?, ?, ?, ?)",
+                (nome, telefone, email, data_cadastro)
+            )
+            
+        return True, "Cliente cadastrado com sucesso!"
+        
+    except Exception as e:
+        return False, f"Erro: {str(e)}"
+
+def listar_clientes():
+    def carregar():
+        with conexao_leitura() as conn:
+            return ler_registros(conn, Cliente, f"SELECT {colunas_sql(Cliente, 'c')} FROM clientes c ORDER BY c.nome")
+    
+    try:
+        return consulta_em_cache(('listar_clientes',), ('clientes',), carregar)
+    except Exception as e:
+        st.error(f"Erro ao listar clientes: {e}")
+        return []
+
+LIMITE_BUSCA_CLIENTES = 20
+
+def _consulta_fts(termo):
+    """Converte o texto digitado em consulta FTS5: cada palavra vira prefixo, todas obrigatórias"""
+    palavras = re.findall(r'\w+', termo)
+    return " ".join(f'"{palavra}"*' for palavra in palavras)
+
+def buscar_clientes(termo, limite=LIMITE_BUSCA_CLIENTES):
+    """Clientes cujo nome, telefone ou email começam com as palavras digitadas (ignora acentos).
+
+    Retorna no máximo `limite` registros Cliente, mais relevantes primeiro;
+    sem termo, os primeiros em ordem alfabética.
+    """
+    consulta = _consulta_fts(termo or "")
+    
+    def carregar():
+        with conexao_leitura() as conn:
+            if consulta:
+                return ler_registros(conn, Cliente, f'''
+                    SELECT {colunas_sql(Cliente, 'c')}
+                    FROM clientes_busca b
+                    JOIN clientes c ON c.id = b.rowid
+                    WHERE clientes_busca MATCH ?
+                    ORDER BY b.rank
+                    LIMIT ?
+                ''', (consulta, limite))
+            return ler_registros(conn, Cliente, f"SELECT {colunas_sql(Cliente, 'c')} FROM clientes c ORDER BY c.nome LIMIT ?",
+                                 (limite,))
+    
+    try:
+        return consulta_em_cache(('buscar_clientes', consulta, limite), ('clientes',), carregar)
+    except Exception as e:
+        st.error(f"Erro ao buscar clientes: {e}")
+        return []
+
+def excluir_cliente(cliente_id):
+    try:
+        with conexao_escrita('clientes') as conn:
+            cur = conn.cursor()
+            
+            # Verificar se tem pedidos
+            cur.execute("SELECT COUNT(*) FROM pedidos WHERE cliente_id = ?", (cliente_id,))
+            if cur.fetchone()[0] > 0:
+                return False, "Cliente possui pedidos e não pode ser excluído"
+            
+            cur.execute("DELETE FROM clientes WHERE id = ?", (cliente_id,))
+        return True, "Cliente excluído com sucesso"
+        
+    except Exception as e:
+        return False, f"Erro: {str(e)}"
+
+# FUNÇÕES PARA PRODUTOS
+def adicionar_produto(nome, categoria, tamanho, cor, preco, estoque, descricao, escola_id):
+    try:
+        with conexao_escrita('produtos', 'estoque_movimentos') as conn:
+            cur = conn.cursor()
+            
+            cur.execute('''
+                INSERT INTO produtos (nome, categoria, tamanho, cor, preco, estoque, descricao, escola_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (nome, categoria, tamanho, cor, preco, estoque, descricao, escola_id))
+            
+            registrar_movimentos(cur, [(cur.lastrowid, estoque)], 'cadastro')
+            
+        return True, "Produto cadastrado com sucesso!"
+    except Exception as e:
+        return False, f"Erro: {str(e)}"
+
+def listar_produtos_por_escola(escola_id=None):
+    def carregar():
+        colunas = colunas_sql(Produto, 'p', escola_nome='e.nome')
+        with conexao_leitura() as conn:
+            if escola_id:
+                return ler_registros(conn, Produto, f'''
+                    SELECT {colunas}
+                    FROM produtos p 
+                    LEFT JOIN escolas e ON p.escola_id = e.id 
+                    WHERE p.escola_id = ?
+                    ORDER BY p.categoria, p.nome
+                ''', (escola_id,))
+            return ler_registros(conn, Produto, f'''
+                SELECT {colunas}
+                FROM produtos p 
+                LEFT JOIN escolas e ON p.escola_id = e.id 
+                ORDER BY e.nome, p.categoria, p.nome
+            ''')
+    
+    try:
+        return consulta_em_cache(('listar_produtos_por_escola', escola_id), ('produtos', 'escolas'), carregar)
+    except Exception as e:
+        st.error(f"Erro ao listar produtos: {e}")
+        return []
+
+def indice_produtos_por_escola(escola_id):
+    """Índice em memória (catalogo.IndiceProdutos) dos produtos da escola, reconstruído só quando produtos mudam"""
+    def carregar():
+        return IndiceProdutos(listar_produtos_por_escola(escola_id), todos_tamanhos, categorias_produtos)
+    
+    try:
+        return consulta_em_cache(('indice_produtos_por_escola', escola_id), ('produtos', 'escolas'), carregar)
+    except Exception as e:
+        st.error(f"Erro ao indexar produtos: {e}")
+        return IndiceProdutos([])
+
+def grade_estoque_por_escola(escola_id):
+    """Estoque pivotado (linhas = categoria/produto/cor, colunas = todos_tamanhos) em uma consulta.
+
+    Retorna (estoques, ids): DataFrames com o mesmo índice e colunas; `ids` traz o
+    produto de cada célula (vazio se não houver ou se houver mais de um cadastro).
+    """
+    def carregar():
+        colunas = []
+        params = []
+        for tamanho in todos_tamanhos:
+            colunas.append("SUM(CASE WHEN tamanho = ? THEN estoque END)")
+            colunas.append("CASE WHEN COUNT(CASE WHEN tamanho = ? THEN 1 END) = 1 "
+                           "THEN MAX(CASE WHEN tamanho = ? THEN id END) END")
+            params.extend([tamanho, tamanho, tamanho])
+        
+        with conexao_leitura() as conn:
+            cur = conn.cursor()
+            cur.execute(f'''
+                SELECT categoria, nome, cor, {", ".join(colunas)}
+                FROM produtos
+                WHERE escola_id = ?
+                GROUP BY categoria, nome, cor
+                ORDER BY categoria, nome, cor
+            ''', params + [escola_id])
+            linhas = cur.fetchall()
+        
+        indice = pd.MultiIndex.from_tuples([tuple(l[:3]) for l in linhas], names=['Categoria', 'Produto', 'Cor'])
+        estoques = pd.DataFrame([list(l[3::2]) for l in linhas], index=indice, columns=todos_tamanhos, dtype='Int64')
+        ids = pd.DataFrame([list(l[4::2]) for l in linhas], index=indice, columns=todos_tamanhos, dtype='Int64')
+        return estoques, ids
+    
+    try:
+        return consulta_em_cache(('grade_estoque_por_escola', escola_id), ('produtos',), carregar)
+    except Exception as e:
+        st.error(f"Erro ao montar grade de estoque: {e}")
+        return pd.DataFrame(), pd.DataFrame()
+
+def sugestao_reposicao_por_escola(escola_id):
+    """Ponto de pedido e sugestão de compra da escola (reposicao.calcular_reposicao).
+
+    Lê as vendas diárias da janela no agregado vendas_produtos_diarias; o resultado
+    fica em cache até mudarem produtos/vendas ou o dia.
+    """
+    hoje = date.today()
+    
+    def carregar():
+        inicio = (hoje - timedelta(days=JANELA_VENDAS_DIAS - 1)).strftime("%Y-%m-%d")
+        with conexao_leitura() as conn:
+            produtos = pd.read_sql_query(
+                "SELECT id, nome, categoria, tamanho, cor, estoque - reservado as estoque FROM produtos WHERE escola_id = ?",
+                conn, params=(escola_id,)
+            )
+            vendas = pd.read_sql_query('''
+                SELECT produto_id, data, quantidade FROM vendas_produtos_diarias
+                WHERE escola_id = ? AND data >= ?
+            ''', conn, params=(escola_id, inicio))
+        return calcular_reposicao(produtos, vendas, hoje)
+    
+    try:
+        return consulta_em_cache(('sugestao_reposicao_por_escola', escola_id, hoje),
+                                 ('produtos', 'vendas_produtos_diarias'), carregar)
+    except Exception as e:
+        st.error(f"Erro ao calcular reposição: {e}")
+        return pd.DataFrame()
+
+def atualizar_estoque(produto_id, nova_quantidade):
+    sucesso, resultado = atualizar_estoque_em_lote([(produto_id, nova_quantidade)])
+    if not sucesso:
+        return False, resultado
+    return True, "Estoque atualizado com sucesso!"
+
+def atualizar_estoque_em_lote(ajustes, motivo='ajuste'):
+    """Aplica vários ajustes [(produto_id, nova_quantidade)] em uma transação.
+
+    Retorna (True, [(produto_id, anterior, novo, diferença)]) com a diferença
+    calculada contra o estoque no momento do commit. Se algum ajuste deixaria o
+    estoque abaixo do reservado para pedidos em aberto, nada é gravado e a
+    mensagem lista cada produto recusado.
+    """
+    if not ajustes:
+        return True, []
+    
+    try:
+        with conexao_escrita('produtos', 'estoque_movimentos') as conn:
+            cur = conn.cursor()
+            novos = dict(ajustes)
+            marcadores = ", ".join("?" * len(novos))
+            cur.execute(f"SELECT id, nome, tamanho, cor, estoque, reservado FROM produtos WHERE id IN ({marcadores})",
+                        list(novos))
+            produtos = {p['id']: p for p in cur.fetchall()}
+            anteriores = {produto_id: p['estoque'] for produto_id, p in produtos.items()}
+            
+            # Conferido com o lock de escrita: a entrega baixa o reservado do físico
+            abaixo = [f"{p['nome']} ({p['tamanho']}/{p['cor']}): novo {novos[produto_id]}, reservado {p['reservado']}"
+                      for produto_id, p in produtos.items() if novos[produto_id] < p['reservado']]
+            if abaixo:
+                return False, "Estoque abaixo do reservado para pedidos em aberto - " + "; ".join(abaixo)
+            
+            cur.executemany("UPDATE produtos SET estoque = ? WHERE id = ?",
+                            [(quantidade, produto_id) for produto_id, quantidade in novos.items()
+                             if produto_id in anteriores])
+            registrar_movimentos(cur, [(produto_id, quantidade - anteriores[produto_id])
+                                       for produto_id, quantidade in novos.items() if produto_id in anteriores],
+                                 motivo)
+        
+        return True, [(produto_id, anteriores[produto_id], quantidade, quantidade - anteriores[produto_id])
+                      for produto_id, quantidade in novos.items() if produto_id in anteriores]
+    except Exception as e:
+        return False, f"Erro: {str(e)}"
+
+# FUNÇÕES PARA MOVIMENTAÇÃO DE ESTOQUE
+INTERVALO_CHECKPOINT_ESTOQUE = 5000  # movimentos entre checkpoints automáticos
+MAIOR_ID_SQLITE = 2 ** 63 - 1  # faixa aberta quando não há checkpoint depois da data
+
+def usuario_atual():
+    return st.session_state.get('username')
+
+def registrar_movimentos(cur, movimentos, motivo, pedido_id=None):
+    """Grava [(produto_id, quantidade com sinal)] no livro de estoque, na transação do cursor"""
+    usuario = usuario_atual()
+    linhas = [(produto_id, quantidade, motivo, pedido_id, usuario)
+              for produto_id, quantidade in movimentos if quantidade]
+    if not linhas:
+        return
+    cur.executemany('''
+        INSERT INTO estoque_movimentos (produto_id, quantidade, motivo, pedido_id, usuario)
+        VALUES (?, ?, ?, ?, ?)
+    ''', linhas)
+    
+    # Checkpoint automático a cada INTERVALO_CHECKPOINT_ESTOQUE movimentos
+    cur.execute('''
+        SELECT (SELECT COALESCE(MAX(id), 0) FROM estoque_movimentos)
+             - (SELECT COALESCE(MAX(ultimo_movimento_id), 0) FROM estoque_checkpoints)
+    ''')
+    if cur.fetchone()[0] >= INTERVALO_CHECKPOINT_ESTOQUE:
+        criar_checkpoint_estoque(cur)
+
+def criar_checkpoint_estoque(cur):
+    """Fotografa o saldo atual de todos os produtos (consistente com o livro, pois roda na transação de escrita)"""
+    cur.execute('''
+        INSERT INTO estoque_checkpoints (ultimo_movimento_id)
+        SELECT COALESCE(MAX(id), 0) FROM estoque_movimentos
+    ''')
+    checkpoint_id = cur.lastrowid
+    cur.execute('''
+        INSERT INTO estoque_checkpoint_itens (checkpoint_id, produto_id, estoque)
+        SELECT ?, id, estoque FROM produtos
+    ''', (checkpoint_id,))
+    return checkpoint_id
+
+def estoque_na_data(escola_id, data):
+    """Saldo (DataFrame) de cada produto da escola ao final do dia `data`.
+
+    Parte do checkpoint mais recente até a data e soma só os movimentos entre ele
+    e o primeiro checkpoint depois da data (faixa limitada do livro, não o
+    histórico inteiro nem tudo o que veio depois).
+    """
+    limite = (data + timedelta(days=1)).strftime("%Y-%m-%d")
+    try:
+        with conexao_leitura() as conn:
+            cur = conn.cursor()
+            cur.execute('''
+                SELECT id, ultimo_movimento_id FROM estoque_checkpoints
+                WHERE data_checkpoint < ?
+                ORDER BY data_checkpoint DESC, id DESC
+                LIMIT 1
+            ''', (limite,))
+            checkpoint = cur.fetchone()
+            checkpoint_id, ultimo_movimento = checkpoint if checkpoint else (None, 0)
+            
+            # O primeiro checkpoint depois da data fecha a faixa: tudo até `data` vem antes dele
+            cur.execute('''
+                SELECT ultimo_movimento_id FROM estoque_checkpoints
+                WHERE data_checkpoint >= ?
+                ORDER BY data_checkpoint, id
+                LIMIT 1
+            ''', (limite,))
+            seguinte = cur.fetchone()
+            ate_movimento = seguinte[0] if seguinte else MAIOR_ID_SQLITE
+            
+            return ler_dataframe(conn, '''
+                SELECT 
+                    p.id, p.nome, p.categoria, p.tamanho, p.cor,
+                    COALESCE(ci.estoque, 0) + COALESCE(m.delta, 0) as estoque
+                FROM produtos p
+                LEFT JOIN estoque_checkpoint_itens ci 
+                    ON ci.checkpoint_id = ? AND ci.produto_id = p.id
+                LEFT JOIN (
+                    -- NOT INDEXED: sem ele o GROUP BY escolhe idx_movimentos_produto_data
+                    -- e varre o livro inteiro; assim lê só a faixa de rowid entre os checkpoints
+                    SELECT produto_id, SUM(quantidade) as delta
+                    FROM estoque_movimentos NOT INDEXED
+                    WHERE id > ? AND id <= ? AND data_movimento < ?
+                    GROUP BY produto_id
+                ) m ON m.produto_id = p.id
+                WHERE p.escola_id = ?
+                ORDER BY p.categoria, p.nome
+            ''', (checkpoint_id, ultimo_movimento, ate_movimento, limite, escola_id),
+                {'id': 'int32', 'categoria': 'category', 'tamanho': 'category', 'cor': 'category', 'estoque': 'int32'})
+    except Exception as e:
+        st.error(f"Erro ao calcular estoque na data: {e}")
+        return pd.DataFrame()
+
+def listar_movimentos_estoque(escola_id, limite=100):
+    """Últimas movimentações de estoque dos produtos da escola (DataFrame)"""
+    try:
+        with conexao_leitura() as conn:
+            return ler_dataframe(conn, '''
+                SELECT m.id, m.data_movimento, p.nome, p.tamanho, p.cor, m.quantidade,
+                       m.motivo, m.pedido_id, m.usuario
+                FROM estoque_movimentos m
+                JOIN produtos p ON m.produto_id = p.id
+                WHERE p.escola_id = ?
+                ORDER BY m.id DESC
+                LIMIT ?
+            ''', (escola_id, limite),
+                {'id': 'int32', 'tamanho': 'category', 'cor': 'category', 'quantidade': 'int32',
+                 'motivo': 'category', 'pedido_id': 'Int32'})
+    except Exception as e:
+        st.error(f"Erro ao listar movimentações: {e}")
+        return pd.DataFrame()
+
+# FUNÇÕES PARA PEDIDOS
+
+# Efeito de cada status no estoque, por unidade do pedido: (reserva, baixa do físico)
+EFEITO_STATUS_ESTOQUE = {
+    'Pendente': (1, 0),
+    'Em produção': (1, 0),
+    'Pronto para entrega': (1, 0),
+    'Entregue': (0, 1),
+    'Cancelado': (0, 0),
+}
+
+def movimentar_reservas(cur, pedido_id, status_anterior, status_novo, motivo=None):
+    """Aplica ao estoque a troca de status do pedido: reserva, libera, baixa na entrega ou estorna.
+
+    `status_anterior=None` é pedido novo; excluir equivale a ir para 'Cancelado'. Quando o
+    disponível (estoque - reservado) diminui, ou quando a entrega baixa o físico, a
+    atualização é condicional e falta de saldo gera IntegrityError, desfazendo a transação.
+    """
+    reserva_antes, baixa_antes = EFEITO_STATUS_ESTOQUE.get(status_anterior, (0, 0))
+    reserva_depois, baixa_depois = EFEITO_STATUS_ESTOQUE.get(status_novo, (1, 0))
+    delta_reserva = reserva_depois - reserva_antes
+    delta_baixa = baixa_depois - baixa_antes
+    if not delta_reserva and not delta_baixa:
+        return
+    
+    cur.execute("SELECT produto_id, SUM(quantidade) FROM pedido_itens WHERE pedido_id = ? GROUP BY produto_id",
+                (pedido_id,))
+    itens = [(item[0], item[1]) for item in cur.fetchall()]
+    consumo = delta_reserva + delta_baixa  # quanto o disponível diminui por unidade
+    
+    if consumo > 0:
+        cur.executemany('''
+            UPDATE produtos SET estoque = estoque - ?, reservado = reservado + ?
+            WHERE id = ? AND estoque - reservado >= ?
+        ''', [(q * delta_baixa, q * delta_reserva, produto_id, q * consumo) for produto_id, q in itens])
+        if cur.rowcount != len(itens):
+            raise sqlite3.IntegrityError("Estoque insuficiente para reservar os itens do pedido")
+    elif delta_baixa > 0:
+        # Entrega de pedido reservado: o disponível não muda, mas o físico nunca fica negativo
+        cur.executemany('''
+            UPDATE produtos SET estoque = estoque - ?, reservado = reservado + ?
+            WHERE id = ? AND estoque >= ?
+        ''', [(q * delta_baixa, q * delta_reserva, produto_id, q * delta_baixa) for produto_id, q in itens])
+        if cur.rowcount != len(itens):
+            raise sqlite3.IntegrityError("Estoque insuficiente para entregar os itens do pedido")
+    else:
+        cur.executemany("UPDATE produtos SET estoque = estoque - ?, reservado = reservado + ? WHERE id = ?",
+                        [(q * delta_baixa, q * delta_reserva, produto_id) for produto_id, q in itens])
+    
+    if delta_baixa:
+        registrar_movimentos(cur, [(produto_id, -q * delta_baixa) for produto_id, q in itens],
+                             motivo or ('entrega' if delta_baixa > 0 else 'estorno_entrega'), pedido_id)
+
+def adicionar_pedido(cliente_id, escola_id, itens, data_entrega, forma_pagamento, observacoes):
+    """Grava o pedido e reserva o estoque em uma única transação.
+
+    O disponível (estoque - reservado) é conferido de novo no commit; se algum
+    item não tiver saldo, nada é gravado e a mensagem lista cada item em falta.
+    """
+    if not itens:
+        return False, "Pedido sem itens"
+    
+    try:
+        with conexao_escrita('pedidos', 'pedido_itens', 'produtos', 'estoque_movimentos',
+                             'vendas_diarias', 'vendas_produtos', 'vendas_produtos_diarias') as conn:
+            cur = conn.cursor()
+            data_pedido = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            quantidade_total = sum(item['quantidade'] for item in itens)
+            valor_total = sum(item['subtotal'] for item in itens)
+            
+            # Quantidade total por produto (o mesmo produto pode aparecer mais de uma vez)
+            solicitado = {}
+            for item in itens:
+                solicitado[item['produto_id']] = solicitado.get(item['produto_id'], 0) + item['quantidade']
+            
+            # Conferir estoque com o lock de escrita já adquirido (BEGIN IMMEDIATE)
+            marcadores = ", ".join("?" * len(solicitado))
+            cur.execute(f"SELECT id, nome, tamanho, cor, estoque - reservado as disponivel "
+                        f"FROM produtos WHERE id IN ({marcadores})", list(solicitado))
+            produtos = {p['id']: p for p in cur.fetchall()}
+            
+            faltas = []
+            for produto_id, quantidade in solicitado.items():
+                produto = produtos.get(produto_id)
+                if produto is None:
+                    faltas.append(f"produto #{produto_id} não encontrado")
+                elif quantidade > produto['disponivel']:
+                    faltas.append(f"{produto['nome']} ({produto['tamanho']}/{produto['cor']}): "
+                                  f"pedido {quantidade}, disponível {produto['disponivel']}")
+            if faltas:
+                return False, "Estoque insuficiente - " + "; ".join(faltas)
+            
+            cur.execute('''
+                INSERT INTO pedidos (cliente_id, escola_id, data_entrega_prevista, forma_pagamento, quantidade_total, valor_total, observacoes)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (cliente_id, escola_id, data_entrega, forma_pagamento, quantidade_total, valor_total, observacoes))
+            
+            pedido_id = cur.lastrowid
+            
+            cur.executemany('''
+                INSERT INTO pedido_itens (pedido_id, produto_id, quantidade, preco_unitario, subtotal)
+                VALUES (?, ?, ?, ?, ?)
+            ''', [(pedido_id, item['produto_id'], item['quantidade'], item['preco_unitario'], item['subtotal'])
+                  for item in itens])
+            
+            # Reserva condicional: nunca deixa o disponível negativo
+            movimentar_reservas(cur, pedido_id, None, 'Pendente')
+            acumular_vendas(cur, pedido_id, 1)
+            
+        return True, pedido_id
+        
+    except Exception as e:
+        return False, f"Erro: {str(e)}"
+
+def listar_pedidos_por_escola(escola_id=None):
+    def carregar():
+        colunas = colunas_sql(Pedido, 'p', cliente_nome='c.nome', escola_nome='e.nome')
+        with conexao_leitura() as conn:
+            if escola_id:
+                return ler_registros(conn, Pedido, f'''
+                    SELECT {colunas}
+                    FROM pedidos p
+                    JOIN clientes c ON p.cliente_id = c.id
+                    JOIN escolas e ON p.escola_id = e.id
+                    WHERE p.escola_id = ?
+                    ORDER BY p.data_pedido DESC
+                ''', (escola_id,))
+            return ler_registros(conn, Pedido, f'''
+                SELECT {colunas}
+                FROM pedidos p
+                JOIN clientes c ON p.cliente_id = c.id
+                JOIN escolas e ON p.escola_id = e.id
+                ORDER BY p.data_pedido DESC
+            ''')
+    
+    try:
+        return consulta_em_cache(('listar_pedidos_por_escola', escola_id), ('pedidos', 'clientes', 'escolas'), carregar)
+    except Exception as e:
+        st.error(f"Erro ao listar pedidos: {e}")
+        return []
+
+def _filtros_pedidos(escola_id=None, status=None, data_inicio=None, data_fim=None, forma_pagamento=None):
+    """Monta as cláusulas WHERE (sargáveis) e parâmetros dos filtros de pedidos"""
+    condicoes = []
+    params = []
+    if escola_id:
+        condicoes.append("p.escola_id = ?")
+        params.append(escola_id)
+    if status:
+        condicoes.append("p.status = ?")
+        params.append(status)
+    if forma_pagamento:
+        condicoes.append("p.forma_pagamento = ?")
+        params.append(forma_pagamento)
+    if data_inicio:
+        condicoes.append("p.data_pedido >= ?")
+        params.append(data_inicio.strftime("%Y-%m-%d"))
+    if data_fim:
+        condicoes.append("p.data_pedido < ?")
+        params.append((data_fim + timedelta(days=1)).strftime("%Y-%m-%d"))
+    return condicoes, params
+
+def listar_pedidos_paginado(escola_id=None, status=None, data_inicio=None, data_fim=None, apos=None, limite=50):
+    """Uma página de pedidos (mais recentes primeiro) com filtros aplicados no SQL.
+
+    `apos` é o cursor (data_pedido, id) do último pedido da página anterior.
+    Retorna (pedidos, cursor_da_proxima_pagina ou None).
+    """
+    def carregar():
+        condicoes, params = _filtros_pedidos(escola_id, status, data_inicio, data_fim)
+        if apos:
+            condicoes.append("(p.data_pedido, p.id) < (?, ?)")
+            params.extend(apos)
+        where = f"WHERE {' AND '.join(condicoes)}" if condicoes else ""
+        
+        with conexao_leitura() as conn:
+            pedidos = ler_registros(conn, Pedido, f'''
+                SELECT {colunas_sql(Pedido, 'p', cliente_nome='c.nome', escola_nome='e.nome')}
+                FROM pedidos p
+                JOIN clientes c ON p.cliente_id = c.id
+                JOIN escolas e ON p.escola_id = e.id
+                {where}
+                ORDER BY p.data_pedido DESC, p.id DESC
+                LIMIT ?
+            ''', params + [limite + 1])
+        
+        if len(pedidos) > limite:
+            pedidos = pedidos[:limite]
+            ultimo = pedidos[-1]
+            return pedidos, (ultimo.data_pedido, ultimo.id)
+        return pedidos, None
+    
+    try:
+        chave = ('listar_pedidos_paginado', escola_id, status, data_inicio, data_fim, apos, limite)
+        return consulta_em_cache(chave, ('pedidos', 'clientes', 'escolas'), carregar)
+    except Exception as e:
+        st.error(f"Erro ao listar pedidos: {e}")
+        return [], None
+
+def contar_pedidos(escola_id=None, status=None, data_inicio=None, data_fim=None):
+    """Total de pedidos que atendem aos filtros"""
+    def carregar():
+        condicoes, params = _filtros_pedidos(escola_id, status, data_inicio, data_fim)
+        where = f"WHERE {' AND '.join(condicoes)}" if condicoes else ""
+        with conexao_leitura() as conn:
+            cur = conn.cursor()
+            cur.execute(f"SELECT COUNT(*) FROM pedidos p {where}", params)
+            return cur.fetchone()[0]
+    
+    try:
+        chave = ('contar_pedidos', escola_id, status, data_inicio, data_fim)
+        return consulta_em_cache(chave, ('pedidos',), carregar)
+    except Exception as e:
+        st.error(f"Erro ao contar pedidos: {e}")
+        return 0
+
+# Transições de status permitidas (origem -> destinos)
+TRANSICOES_STATUS = {
+    'Pendente': {'Em produção', 'Pronto para entrega', 'Entregue', 'Cancelado'},
+    'Em produção': {'Pendente', 'Pronto para entrega', 'Entregue', 'Cancelado'},
+    'Pronto para entrega': {'Em produção', 'Entregue', 'Cancelado'},
+    'Entregue': {'Pronto para entrega'},
+    'Cancelado': {'Pendente'},
+}
+
+# Ids por comando nas alterações em lote (o SQLite limita os parâmetros por consulta)
+TAMANHO_LOTE_IDS = 500
+
+def ids_pedidos_filtrados(escola_id=None, status=None, data_inicio=None, data_fim=None):
+    """Ids de todos os pedidos que atendem aos filtros (para ações em lote)"""
+    condicoes, params = _filtros_pedidos(escola_id, status, data_inicio, data_fim)
+    where = f"WHERE {' AND '.join(condicoes)}" if condicoes else ""
+    try:
+        with conexao_leitura() as conn:
+            cur = conn.cursor()
+            cur.execute(f"SELECT p.id FROM pedidos p {where} ORDER BY p.id", params)
+            return [linha[0] for linha in cur.fetchall()]
+    except Exception as e:
+        st.error(f"Erro ao listar pedidos: {e}")
+        return []
+
+def atualizar_status_pedidos_em_lote(pedido_ids, novo_status):
+    """Move vários pedidos para `novo_status` em uma transação.
+
+    Pedidos cuja transição não é permitida (TRANSICOES_STATUS) ficam de fora, assim
+    como os que não têm saldo para a reserva (cada um num savepoint, sem abortar o
+    lote). Os demais têm estoque/agregados ajustados e o status gravado com
+    UPDATE ... WHERE id IN (...), em blocos de TAMANHO_LOTE_IDS.
+    Retorna (True, {'alterados': n, 'recusados': [(id, status)], 'sem_estoque': [id]}).
+    """
+    pedido_ids = list(dict.fromkeys(pedido_ids))
+    resultado = {'alterados': 0, 'recusados': [], 'sem_estoque': []}
+    if not pedido_ids:
+        return True, resultado
+    
+    try:
+        with conexao_escrita('pedidos', 'produtos', 'estoque_movimentos',
+                             'vendas_diarias', 'vendas_produtos', 'vendas_produtos_diarias') as conn:
+            cur = conn.cursor()
+            # Blocos de ids: "Todos os pedidos do filtro" pode passar do limite de parâmetros do SQLite
+            blocos = [pedido_ids[i:i + TAMANHO_LOTE_IDS] for i in range(0, len(pedido_ids), TAMANHO_LOTE_IDS)]
+            atuais = []
+            for bloco in blocos:
+                marcadores = ", ".join("?" * len(bloco))
+                cur.execute(f"SELECT id, status FROM pedidos WHERE id IN ({marcadores})", bloco)
+                atuais.extend((linha[0], linha[1]) for linha in cur.fetchall())
+            
+            permitidos = [(pid, status) for pid, status in atuais if novo_status in TRANSICOES_STATUS.get(status, ())]
+            resultado['recusados'] = [(pid, status) for pid, status in atuais
+                                      if status != novo_status and novo_status not in TRANSICOES_STATUS.get(status, ())]
+            
+            # Estoque e agregados dependem do status de origem de cada pedido
+            validos = []
+            for pid, status in permitidos:
+                cur.execute("SAVEPOINT pedido_lote")
+                try:
+                    movimentar_reservas(cur, pid, status, novo_status)
+                except sqlite3.IntegrityError:
+                    cur.execute("ROLLBACK TO pedido_lote")
+                    resultado['sem_estoque'].append(pid)
+                    continue
+                finally:
+                    cur.execute("RELEASE pedido_lote")
+                if novo_status == 'Cancelado':
+                    acumular_vendas(cur, pid, -1)
+                validos.append((pid, status))
+            
+            # Só pedidos entregues têm data de entrega: sair de 'Entregue' limpa a data
+            data_entrega = datetime.now().strftime("%Y-%m-%d") if novo_status == 'Entregue' else None
+            ids = [pid for pid, _ in validos]
+            for i in range(0, len(ids), TAMANHO_LOTE_IDS):
+                bloco = ids[i:i + TAMANHO_LOTE_IDS]
+                marcadores = ", ".join("?" * len(bloco))
+                cur.execute(f'''
+                    UPDATE pedidos 
+                    SET status = ?, data_entrega_real = ?
+                    WHERE id IN ({marcadores})
+                ''', [novo_status, data_entrega] + bloco)
+                resultado['alterados'] += cur.rowcount
+            
+            for pid, status in validos:
+                if status == 'Cancelado':
+                    acumular_vendas(cur, pid, 1)
+            
+        return True, resultado
+        
+    except Exception as e:
+        return False, f"Erro: {str(e)}"
+
+def atualizar_status_pedido(pedido_id, novo_status):
+    sucesso, resultado = atualizar_status_pedidos_em_lote([pedido_id], novo_status)
+    if not sucesso:
+        return False, resultado
+    if resultado['sem_estoque']:
+        return False, f"Estoque insuficiente para os itens do pedido #{pedido_id}"
+    if resultado['recusados']:
+        status_atual = resultado['recusados'][0][1]
+        return False, f"Transição não permitida: {status_atual} → {novo_status}"
+    return True, "Status do pedido atualizado com sucesso!"
+
+def excluir_pedido(pedido_id):
+    try:
+        with conexao_escrita('pedidos', 'pedido_itens', 'produtos', 'estoque_movimentos',
+                             'vendas_diarias', 'vendas_produtos', 'vendas_produtos_diarias') as conn:
+            cur = conn.cursor()
+            
+            acumular_vendas(cur, pedido_id, -1)
+            
+            # Liberar reservas (ou estornar a baixa, se já entregue)
+            cur.execute("SELECT status FROM pedidos WHERE id = ?", (pedido_id,))
+            atual = cur.fetchone()
+            if atual:
+                movimentar_reservas(cur, pedido_id, atual[0], 'Cancelado', 'exclusao_pedido')
+            
+            # Excluir pedido
+            cur.execute("DELETE FROM pedidos WHERE id = ?", (pedido_id,))
+            
+        return True, "Pedido excluído com sucesso"
+        
+    except Exception as e:
+        return False, f"Erro: {str(e)}"
+
+# FUNÇÕES PARA DASHBOARD
+def obter_metricas_dashboard():
+    """Contadores globais e por escola (pedidos, pendentes, produtos, vendas) em uma consulta.
+
+    O alerta de estoque é a contagem de produtos no ponto de pedido
+    (sugestao_reposicao_por_escola), o mesmo número da página de Estoque.
+    """
+    hoje = date.today()
+    
+    def carregar():
+        metricas = {
+            'total_pedidos': 0,
+            'pedidos_pendentes': 0,
+            'total_produtos': 0,
+            'produtos_repor': 0,
+            'total_vendas': 0.0,
+            'total_clientes': 0,
+            'escolas': []
+        }
+        with conexao_leitura() as conn:
+            cur = conn.cursor()
+            cur.execute('''
+                SELECT 
+                    e.id,
+                    e.nome,
+                    COALESCE(pe.pedidos, 0) as pedidos,
+                    COALESCE(pe.pendentes, 0) as pendentes,
+                    COALESCE(pe.entregues, 0) as entregues,
+                    COALESCE(pe.vendas, 0) as vendas,
+                    COALESCE(pr.produtos, 0) as produtos
+                FROM escolas e
+                LEFT JOIN (
+                    SELECT escola_id,
+                           COUNT(*) as pedidos,
+                           SUM(status = 'Pendente') as pendentes,
+                           SUM(status = 'Entregue') as entregues,
+                           -- Mesma regra do relatório de vendas e das exportações
+                           SUM(CASE WHEN status <> 'Cancelado' THEN valor_total END) as vendas
+                    FROM pedidos
+                    GROUP BY escola_id
+                ) pe ON pe.escola_id = e.id
+                LEFT JOIN (
+                    SELECT escola_id,
+                           COUNT(*) as produtos
+                    FROM produtos
+                    GROUP BY escola_id
+                ) pr ON pr.escola_id = e.id
+                ORDER BY e.nome
+            ''')
+            escolas = cur.fetchall()
+            
+            cur.execute('SELECT COUNT(*) FROM clientes')
+            metricas['total_clientes'] = cur.fetchone()[0]
+        
+        for escola in escolas:
+            escola = dict(escola)
+            reposicao = sugestao_reposicao_por_escola(escola['id'])
+            escola['repor'] = int(reposicao['repor'].sum()) if not reposicao.empty else 0
+            metricas['escolas'].append(escola)
+            metricas['total_pedidos'] += escola['pedidos']
+            metricas['pedidos_pendentes'] += escola['pendentes']
+            metricas['total_produtos'] += escola['produtos']
+            metricas['produtos_repor'] += escola['repor']
+            metricas['total_vendas'] += float(escola['vendas'])
+        return metricas
+    
+    try:
+        return consulta_em_cache(('obter_metricas_dashboard', hoje),
+                                 ('pedidos', 'produtos', 'clientes', 'escolas', 'vendas_produtos_diarias'), carregar)
+    except Exception as e:
+        st.error(f"Erro ao carregar métricas: {e}")
+        return {
+            'total_pedidos': 0,
+            'pedidos_pendentes': 0,
+            'total_produtos': 0,
+            'produtos_repor': 0,
+            'total_vendas': 0.0,
+            'total_clientes': 0,
+            'escolas': []
+        }
+
+# =========================================
+# 📥 IMPORTAÇÃO EM LOTE (CSV / XLSX)
+# =========================================
+
+TAMANHO_LOTE_IMPORTACAO = 1000
+
+def _texto(valor):
+    """Normaliza uma célula para texto (XLSX traz números como float: 2.0 -> '2')"""
+    if valor is None:
+        return ''
+    if isinstance(valor, float) and valor.is_integer():
+        valor = int(valor)
+    return str(valor).strip()
+
+def _numero(valor, tipo=float):
+    """Converte célula numérica aceitando vírgula decimal; ValueError se inválida"""
+    texto = _texto(valor).replace('R$', '').strip()
+    if ',' in texto:
+        texto = texto.replace('.', '').replace(',', '.')
+    if tipo is int:
+        numero = float(texto)
+        if not numero.is_integer():
+            raise ValueError(texto)
+        return int(numero)
+    return tipo(texto)
+
+def ler_planilha(arquivo):
+    """Itera (nº da linha no arquivo, dict com cabeçalho em minúsculas) de um CSV ou XLSX enviado.
+
+    Não carrega tudo na memória. Linhas em branco são puladas, mas a numeração segue
+    a do arquivo, para o relatório de erros apontar a linha certa.
+    """
+    arquivo.seek(0)
+    if arquivo.name.lower().endswith('.xlsx'):
+        from openpyxl import load_workbook
+        planilha = load_workbook(arquivo, read_only=True, data_only=True)
+        try:
+            linhas = planilha.active.iter_rows(values_only=True)
+            cabecalho = [_texto(c).lower() for c in next(linhas, ())]
+            for numero, valores in enumerate(linhas, start=2):
+                if any(v is not None for v in valores):
+                    yield numero, dict(zip(cabecalho, valores))
+        finally:
+            planilha.close()
+    else:
+        texto = io.TextIOWrapper(arquivo, encoding='utf-8-sig', newline='')
+        try:
+            primeira = texto.readline()
+            # Excel em português salva CSV com ';'
+            separador = ';' if primeira.count(';') > primeira.count(',') else ','
+            leitor = csv.DictReader(itertools.chain([primeira], texto), delimiter=separador)
+            leitor.fieldnames = [c.strip().lower() for c in leitor.fieldnames or []]
+            for linha in leitor:
+                if any(linha.values()):
+                    yield leitor.line_num, linha
+        finally:
+            texto.detach()
+
+def validar_produtos(linhas, escolas):
+    """Valida linhas de produtos; retorna (tuplas prontas para INSERT, [(linha, erro)])
+
+    Produtos que já existem (escola, nome, tamanho, cor) ou que se repetem no arquivo
+    viram erro: importar de novo o mesmo arquivo não duplica o catálogo.
+    """
+    escolas_por_nome = {e.nome.lower(): e.id for e in escolas}
+    categorias = {c.lower(): c for c in categorias_produtos}
+    tamanhos = {t.upper(): t for t in todos_tamanhos}
+    with conexao_leitura() as conn:
+        cadastrados = {
+            (p['escola_id'], p['nome'].lower(), (p['tamanho'] or '').upper(), (p['cor'] or '').lower())
+            for p in conn.execute("SELECT escola_id, nome, tamanho, cor FROM produtos").fetchall()
+        }
+    no_arquivo = {}
+    validas, erros = [], []
+    
+    for numero, linha in linhas:
+        nome = _texto(linha.get('nome'))
+        escola_id = escolas_por_nome.get(_texto(linha.get('escola')).lower())
+        categoria = categorias.get(_texto(linha.get('categoria')).lower())
+        tamanho = tamanhos.get(_texto(linha.get('tamanho')).upper())
+        cor = _texto(linha.get('cor'))
+        
+        problemas = []
+        if not nome:
+            problemas.append("nome vazio")
+        if escola_id is None:
+            problemas.append(f"escola '{_texto(linha.get('escola'))}' não cadastrada")
+        if categoria is None:
+            problemas.append(f"categoria '{_texto(linha.get('categoria'))}' inválida")
+        if tamanho is None:
+            problemas.append(f"tamanho '{_texto(linha.get('tamanho'))}' inválido")
+        if not cor:
+            problemas.append("cor vazia")
+        try:
+            preco = _numero(linha.get('preco'))
+            if preco < 0:
+                raise ValueError
+        except ValueError:
+            problemas.append(f"preço '{_texto(linha.get('preco'))}' inválido")
+        try:
+            estoque = _numero(linha.get('estoque') or 0, int)
+            if estoque < 0:
+                raise ValueError
+        except ValueError:
+            problemas.append(f"estoque '{_texto(linha.get('estoque'))}' inválido")
+        
+        if not problemas:
+            chave = (escola_id, nome.lower(), tamanho.upper(), cor.lower())
+            if chave in cadastrados:
+                problemas.append("produto já cadastrado (escola/nome/tamanho/cor); use a importação de estoque para a contagem")
+            elif chave in no_arquivo:
+                problemas.append(f"produto repetido no arquivo (linha {no_arquivo[chave]})")
+            else:
+                no_arquivo[chave] = numero
+        
+        if problemas:
+            erros.append((numero, "; ".join(problemas)))
+        else:
+            validas.append((nome, categoria, tamanho, cor, preco, estoque,
+                            _texto(linha.get('descricao')) or None, escola_id))
+    return validas, erros
+
+def validar_clientes(linhas, escolas):
+    """Valida linhas de clientes; retorna (tuplas prontas para INSERT, [(linha, erro)])"""
+    data_cadastro = datetime.now().strftime("%Y-%m-%d")
+    validas, erros = [], []
+    
+    for numero, linha in linhas:
+        nome = _texto(linha.get('nome'))
+        telefone = _texto(linha.get('telefone'))
+        email = _texto(linha.get('email'))
+        
+        problemas = []
+        if not nome:
+            problemas.append("nome vazio")
+        if email and '@' not in email:
+            problemas.append(f"email '{email}' inválido")
+        
+        if problemas:
+            erros.append((numero, "; ".join(problemas)))
+        else:
+            validas.append((nome, telefone or None, email or None, data_cadastro))
+    return validas, erros
+
+def validar_estoque(linhas, escolas):
+    """Valida contagens de estoque por id ou por (escola, nome, tamanho, cor); retorna ([(estoque, id)], erros)"""
+    escolas_por_id = {e.id: e.nome.lower() for e in escolas}
+    with conexao_leitura() as conn:
+        produtos = conn.execute("SELECT id, escola_id, nome, tamanho, cor, reservado FROM produtos").fetchall()
+    reservados = {p['id']: p['reservado'] for p in produtos}
+    por_chave = {
+        (escolas_por_id.get(p['escola_id'], ''), p['nome'].lower(), (p['tamanho'] or '').upper(), (p['cor'] or '').lower()): p['id']
+        for p in produtos
+    }
+    validas, erros = [], []
+    
+    for numero, linha in linhas:
+        problemas = []
+        if _texto(linha.get('id')):
+            try:
+                produto_id = _numero(linha.get('id'), int)
+            except ValueError:
+                produto_id = None
+            if produto_id not in reservados:
+                problemas.append(f"produto id '{_texto(linha.get('id'))}' não encontrado")
+        else:
+            chave = (_texto(linha.get('escola')).lower(), _texto(linha.get('nome')).lower(),
+                     _texto(linha.get('tamanho')).upper(), _texto(linha.get('cor')).lower())
+            produto_id = por_chave.get(chave)
+            if produto_id is None:
+                problemas.append("produto não encontrado (escola/nome/tamanho/cor)")
+        try:
+            estoque = _numero(linha.get('estoque'), int)
+            if estoque < 0:
+                raise ValueError
+            if estoque < reservados.get(produto_id, 0):
+                problemas.append(f"estoque {estoque} abaixo do reservado para pedidos em aberto "
+                                 f"({reservados[produto_id]})")
+        except ValueError:
+            problemas.append(f"estoque '{_texto(linha.get('estoque'))}' inválido")
+        
+        if problemas:
+            erros.append((numero, "; ".join(problemas)))
+        else:
+            validas.append((estoque, produto_id))
+    return validas, erros
+
+def importar_produtos(linhas, tamanho_lote=TAMANHO_LOTE_IMPORTACAO):
+    """Cadastra produtos em lotes, registrando o estoque inicial no livro de movimentações"""
+    gravadas = 0
+    try:
+        for inicio in range(0, len(linhas), tamanho_lote):
+            lote = linhas[inicio:inicio + tamanho_lote]
+            with conexao_escrita('produtos', 'estoque_movimentos') as conn:
+                cur = conn.cursor()
+                cur.execute("SELECT COALESCE(MAX(id), 0) FROM produtos")
+                ultimo_id = cur.fetchone()[0]
+                cur.executemany('''
+                    INSERT INTO produtos (nome, categoria, tamanho, cor, preco, estoque, descricao, escola_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', lote)
+                cur.execute("SELECT id, estoque FROM produtos WHERE id > ?", (ultimo_id,))
+                registrar_movimentos(cur, cur.fetchall(), 'importacao')
+            gravadas += len(lote)
+        return True, f"{gravadas} linha(s) importada(s) com sucesso!"
+    except Exception as e:
+        return False, f"Erro após {gravadas} linha(s) importada(s): {str(e)}"
+
+def importar_contagem_estoque(linhas, tamanho_lote=TAMANHO_LOTE_IMPORTACAO):
+    """Aplica contagens [(estoque, produto_id)] em lotes, com o delta registrado no livro"""
+    gravadas = 0
+    for inicio in range(0, len(linhas), tamanho_lote):
+        lote = linhas[inicio:inicio + tamanho_lote]
+        sucesso, resultado = atualizar_estoque_em_lote([(produto_id, estoque) for estoque, produto_id in lote],
+                                                       motivo='importacao')
+        if not sucesso:
+            return False, f"Erro após {gravadas} linha(s) importada(s): {resultado}"
+        gravadas += len(lote)
+    return True, f"{gravadas} linha(s) importada(s) com sucesso!"
+
+def gravar_em_lotes(sql, linhas, tabelas, tamanho_lote=TAMANHO_LOTE_IMPORTACAO):
+    """executemany em lotes, uma transação curta por lote para não segurar o lock de escrita"""
+    gravadas = 0
+    try:
+        for inicio in range(0, len(linhas), tamanho_lote):
+            lote = linhas[inicio:inicio + tamanho_lote]
+            with conexao_escrita(*tabelas) as conn:
+                conn.executemany(sql, lote)
+            gravadas += len(lote)
+        return True, f"{gravadas} linha(s) importada(s) com sucesso!"
+    except Exception as e:
+        return False, f"Erro após {gravadas} linha(s) importada(s): {str(e)}"
+
+IMPORTACOES = {
+    'produtos': {
+        'colunas': ['escola', 'nome', 'categoria', 'tamanho', 'cor', 'preco', 'estoque', 'descricao'],
+        'preview': ['Nome', 'Categoria', 'Tamanho', 'Cor', 'Preço', 'Estoque', 'Descrição', 'Escola ID'],
+        'validar': validar_produtos,
+        'gravar': importar_produtos
+    },
+    'clientes': {
+        'colunas': ['nome', 'telefone', 'email'],
+        'preview': ['Nome', 'Telefone', 'Email', 'Data Cadastro'],
+        'validar': validar_clientes,
+        'gravar': lambda linhas: gravar_em_lotes(
+            "INSERT INTO clientes (nome, telefone, email, data_cadastro) VALUES (?, ?, ?, ?)",
+            linhas,
+            ('clientes',)
+        )
+    },
+    'estoque': {
+        'colunas': ['id', 'estoque', '(ou) escola', 'nome', 'tamanho', 'cor'],
+        'preview': ['Novo Estoque', 'Produto ID'],
+        'validar': validar_estoque,
+        'gravar': importar_contagem_estoque
+    }
+}
+
+# =========================================
+# 📊 FUNÇÕES PARA RELATÓRIOS - SQLITE
+# =========================================
+
+def gerar_relatorio_vendas_por_escola(escola_id=None, data_inicio=None, data_fim=None, status=None, forma_pagamento=None):
+    """Gera relatório de vendas por dia e escola; retorna (DataFrame, resumo).
+
+    Sem filtro de status/pagamento lê o agregado vendas_diarias (cancelados fora);
+    com eles, agrega os pedidos do período pelo índice de data_pedido. O resumo
+    (total, média e maior valor diário) sai da mesma consulta, por funções de janela.
+    """
+    resumo = {'total': 0.0, 'media': 0.0, 'maior': 0.0}
+    try:
+        condicoes = []
+        params = []
+        if status or forma_pagamento:
+            filtros, params = _filtros_pedidos(escola_id, status, data_inicio, data_fim, forma_pagamento)
+            if not status:
+                filtros.append("p.status <> 'Cancelado'")
+            origem = f'''(
+                SELECT DATE(p.data_pedido) as data, p.escola_id,
+                       COUNT(*) as pedidos, SUM(p.quantidade_total) as itens, SUM(p.valor_total) as valor
+                FROM pedidos p
+                WHERE {' AND '.join(filtros)}
+                GROUP BY DATE(p.data_pedido), p.escola_id
+            )'''
+        else:
+            origem = 'vendas_diarias'
+            if escola_id:
+                condicoes.append("v.escola_id = ?")
+                params.append(escola_id)
+            if data_inicio:
+                condicoes.append("v.data >= ?")
+                params.append(data_inicio.strftime("%Y-%m-%d"))
+            if data_fim:
+                condicoes.append("v.data <= ?")
+                params.append(data_fim.strftime("%Y-%m-%d"))
+        where = f"WHERE {' AND '.join(condicoes)}" if condicoes else ""
+        
+        with conexao_leitura() as conn:
+            dados = ler_dataframe(conn, f'''
+                SELECT 
+                    v.data,
+                    e.nome as escola,
+                    v.pedidos as total_pedidos,
+                    v.itens as total_itens,
+                    v.valor as total_vendas,
+                    SUM(v.valor) OVER () as resumo_total,
+                    AVG(v.valor) OVER () as resumo_media,
+                    MAX(v.valor) OVER () as resumo_maior
+                FROM {origem} v
+                JOIN escolas e ON v.escola_id = e.id
+                {where}
+                ORDER BY v.data DESC, e.nome
+            ''', params, {'escola': 'category', 'total_pedidos': 'int32', 'total_itens': 'Int32'})
+        
+        if not dados.empty:
+            primeira = dados.iloc[0]
+            resumo = {'total': primeira['resumo_total'], 'media': primeira['resumo_media'], 'maior': primeira['resumo_maior']}
+            df = dados[['data', 'escola', 'total_pedidos', 'total_itens', 'total_vendas']]
+            df.columns = ['Data', 'Escola', 'Total Pedidos', 'Total Itens', 'Total Vendas (R$)']
+            if escola_id:
+                df = df.drop(columns='Escola')
+            return df, resumo
+        else:
+            return pd.DataFrame(), resumo
+            
+    except Exception as e:
+        st.error(f"Erro ao gerar relatório: {e}")
+        return pd.DataFrame(), resumo
+
+def gerar_relatorio_produtos_por_escola(escola_id=None, limite=None, data_inicio=None, data_fim=None,
+                                        status=None, forma_pagamento=None):
+    """Gera relatório de produtos mais vendidos por escola.
+
+    Sem filtro de status/pagamento usa os contadores de vendas; com eles, agrega
+    os itens dos pedidos filtrados (período pelo índice de data_pedido). Sem
+    status, cancelados ficam fora, como nos contadores.
+    """
+    try:
+        with conexao_leitura() as conn:
+            if status or forma_pagamento:
+                condicoes, params = _filtros_pedidos(escola_id, status, data_inicio, data_fim, forma_pagamento)
+                if not status:
+                    condicoes.append("p.status <> 'Cancelado'")
+                sql = f'''
+                    SELECT 
+                        pr.nome as produto,
+                        pr.categoria,
+                        pr.tamanho,
+                        pr.cor,
+                        e.nome as escola,
+                        SUM(pi.quantidade) as total_vendido,
+                        SUM(pi.subtotal) as total_faturado
+                    FROM pedidos p
+                    JOIN pedido_itens pi ON pi.pedido_id = p.id
+                    JOIN produtos pr ON pi.produto_id = pr.id
+                    JOIN escolas e ON p.escola_id = e.id
+                    WHERE {' AND '.join(condicoes)}
+                    GROUP BY pr.id, e.id
+                    ORDER BY total_vendido DESC
+                '''
+                if limite:
+                    sql += " LIMIT ?"
+                    params.append(limite)
+                dados = conn.execute(sql, params).fetchall()
+            else:
+                dados = top_produtos_vendidos(conn, escola_id, limite, data_inicio, data_fim)
+        
+        if dados:
+            df = pd.DataFrame.from_records(
+                dados, columns=['Produto', 'Categoria', 'Tamanho', 'Cor', 'Escola', 'Total Vendido', 'Total Faturado (R$)']
+            )
+            if escola_id:
+                # A escola já está no filtro; a coluna só aparece no relatório geral
+                df = df.drop(columns='Escola')
+            return df
+        else:
+            return pd.DataFrame()
+            
+    except Exception as e:
+        st.error(f"Erro ao gerar relatório: {e}")
+        return pd.DataFrame()
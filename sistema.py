@@ -0,0 +1,70 @@
+import threading
+import time
+
+from database import conexao_leitura, versao_schema, MIGRACOES
+from autenticacao import init_db
+
+# =========================================
+# 🚦 INICIALIZAÇÃO DO PROCESSO
+# =========================================
+
+# Estado único do processo, compartilhado por todas as sessões do servidor
+_lock_inicializacao = threading.Lock()
+_estado = {'inicializado': False, 'aquecido': False, 'duracao_ms': None, 'erro_aquecimento': None}
+
+
+def aquecer_caches():
+    """Carrega no cache as consultas que toda sessão faz ao entrar (escolas e produtos de cada escola)"""
+    from servicos import listar_escolas, listar_produtos_por_escola, indice_produtos_por_escola
+
+    try:
+        for escola in listar_escolas():
+            listar_produtos_por_escola(escola.id)
+            indice_produtos_por_escola(escola.id)
+        _estado['aquecido'] = True
+    except Exception as e:
+        _estado['erro_aquecimento'] = str(e)
+
+
+def inicializar_sistema(aquecer=True):
+    """Migrações e dados padrão uma única vez por processo; retorna True quando o sistema está pronto.
+
+    Sessões que chegam durante a inicialização esperam no lock em vez de repetir
+    o trabalho. O aquecimento do cache roda em segundo plano, sem atrasar o login.
+    """
+    if _estado['inicializado']:
+        return True
+
+    with _lock_inicializacao:
+        if _estado['inicializado']:
+            return True
+
+        inicio = time.perf_counter()
+        if not init_db():
+            return False
+        _estado['duracao_ms'] = (time.perf_counter() - inicio) * 1000
+        _estado['inicializado'] = True
+
+    if aquecer:
+        threading.Thread(target=aquecer_caches, name='aquecimento-cache', daemon=True).start()
+    return True
+
+
+def verificar_prontidao():
+    """Estado da inicialização e do schema: pronto = inicializado e schema na última migração"""
+    esperada = MIGRACOES[-1][0]
+    try:
+        with conexao_leitura() as conn:
+            versao = versao_schema(conn)
+    except Exception:
+        versao = None
+
+    return {
+        'pronto': _estado['inicializado'] and versao == esperada,
+        'inicializado': _estado['inicializado'],
+        'versao_schema': versao,
+        'versao_esperada': esperada,
+        'aquecido': _estado['aquecido'],
+        'duracao_ms': _estado['duracao_ms'],
+        'erro_aquecimento': _estado['erro_aquecimento'],
+    }
@@ -0,0 +1,160 @@
+"""Planos das consultas quentes: nenhuma varredura completa das tabelas grandes.
+
+O SQL verificado é o que as funções de servicos.py realmente executam (capturado
+com set_trace_callback nas conexões do pool), numa base sintética pequena:
+
+    python -m pytest -q tests/test_planos_consultas.py
+"""
+import os
+import re
+import shutil
+import sys
+import tempfile
+from datetime import date
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [RAIZ, os.path.join(RAIZ, 'benchmarks')]
+
+# Tabelas que crescem com o uso; escolas, usuários e checkpoints podem ser varridos
+TABELAS_GRANDES = {
+    'pedidos', 'pedido_itens', 'produtos', 'clientes', 'estoque_movimentos', 'estoque_checkpoint_itens',
+    'vendas_diarias', 'vendas_produtos', 'vendas_produtos_diarias',
+}
+DATA = date(2025, 6, 1)  # entre os dois checkpoints da base, longe do fim do livro
+
+
+def _casos(servicos):
+    """{nome: (chamada, passos SCAN aceitos)}"""
+    return {
+        'pedidos por escola': (lambda: servicos.listar_pedidos_por_escola(1), ()),
+        'produtos por escola': (lambda: servicos.listar_produtos_por_escola(1), ()),
+        'página de pedidos filtrada': (lambda: servicos.listar_pedidos_paginado(
+            escola_id=1, status='Pendente', data_inicio=DATA, data_fim=DATA,
+            apos=('2025-06-01 12:00:00', 10 ** 6), limite=50), ()),
+        # Sem filtro, percorre o índice de data na ordem da página e para no LIMIT
+        'página de pedidos sem filtro': (lambda: servicos.listar_pedidos_paginado(limite=50),
+                                         ('SCAN p USING INDEX idx_pedidos_data',)),
+        'contagem de pedidos': (lambda: servicos.contar_pedidos(escola_id=1, status='Pendente'), ()),
+        'top produtos': (lambda: servicos.gerar_relatorio_produtos_por_escola(limite=10), ()),
+        'top produtos no período': (lambda: servicos.gerar_relatorio_produtos_por_escola(
+            escola_id=1, limite=10, data_inicio=DATA, data_fim=DATA), ()),
+        'top produtos por status': (lambda: servicos.gerar_relatorio_produtos_por_escola(
+            limite=10, status='Entregue', data_inicio=DATA, data_fim=DATA), ()),
+        'vendas da escola no período': (lambda: servicos.gerar_relatorio_vendas_por_escola(
+            escola_id=1, data_inicio=DATA, data_fim=DATA), ()),
+        'vendas por pagamento': (lambda: servicos.gerar_relatorio_vendas_por_escola(
+            forma_pagamento='PIX', data_inicio=DATA, data_fim=DATA), ()),
+        'estoque na data': (lambda: servicos.estoque_na_data(1, DATA), ()),
+        'estoque na data sem checkpoint seguinte': (lambda: servicos.estoque_na_data(1, date.today()), ()),
+        'movimentos de estoque': (lambda: servicos.listar_movimentos_estoque(1), ()),
+        'busca de clientes': (lambda: servicos.buscar_clientes('Ana'), ()),
+        'alteração de status': (lambda: servicos.atualizar_status_pedido(5, 'Cancelado'), ()),
+        'exclusão de pedido': (lambda: servicos.excluir_pedido(6), ()),
+    }
+
+
+@pytest.fixture(scope='module')
+def base():
+    pasta = tempfile.mkdtemp()
+    os.environ['FARDAMENTOS_DB'] = os.path.join(pasta, 'planos.db')
+    import database
+    import dados_sinteticos
+    import servicos
+
+    dados_sinteticos.gerar_base(escolas=2, clientes=300, pedidos=3000, semente=1)
+    # Dois trechos do livro, cada um fechado por um checkpoint datado (janeiro e junho);
+    # entre eles, +2 em cada produto da escola 1 em março
+    with database.conexao_escrita() as conn:
+        cur = conn.cursor()
+        cur.execute("UPDATE estoque_movimentos SET data_movimento = '2025-01-15 10:00:00'")
+        servicos.criar_checkpoint_estoque(cur)
+        cur.execute("UPDATE produtos SET estoque = estoque + 2 WHERE escola_id = 1")
+        cur.execute('''
+            INSERT INTO estoque_movimentos (produto_id, quantidade, motivo, data_movimento)
+            SELECT id, 2, 'ajuste', '2025-03-10 10:00:00' FROM produtos WHERE escola_id = 1
+        ''')
+        servicos.criar_checkpoint_estoque(cur)
+        cur.execute("UPDATE estoque_checkpoints SET data_checkpoint = "
+                    "CASE WHEN id = (SELECT MIN(id) FROM estoque_checkpoints) "
+                    "THEN '2025-01-31 23:00:00' ELSE '2025-06-30 23:00:00' END")
+
+    # Conexões abertas daqui em diante registram cada comando executado
+    database.get_pool().fechar_todas()
+    executados = []
+    abrir = database.PoolConexoes._abrir
+
+    def abrir_com_rastreio(pool):
+        conn = abrir(pool)
+        conn.set_trace_callback(executados.append)
+        return conn
+
+    database.PoolConexoes._abrir = abrir_com_rastreio
+    yield database, servicos, executados
+    database.PoolConexoes._abrir = abrir
+    database.get_pool().fechar_todas()
+    shutil.rmtree(pasta, ignore_errors=True)
+
+
+def _tabelas_por_alias(sql):
+    """{alias ou nome: tabela} das tabelas citadas em FROM/JOIN (subconsultas ficam de fora)"""
+    aliases = {}
+    for tabela, alias in re.findall(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|JOIN\b|LEFT\b|'
+                                    r'INNER\b|NOT\b|GROUP\b|ORDER\b|LIMIT\b)(\w+))?', sql, re.IGNORECASE):
+        aliases[tabela] = tabela
+        if alias:
+            aliases[alias] = tabela
+    return aliases
+
+
+def varreduras(conn, sql):
+    """Passos SCAN do plano que percorrem uma das TABELAS_GRANDES"""
+    aliases = _tabelas_por_alias(sql)
+    passos = []
+    for linha in conn.execute(f'EXPLAIN QUERY PLAN {sql}'):
+        detalhe = linha[3]
+        partes = detalhe.split()
+        if partes[0] != 'SCAN' or 'VIRTUAL TABLE' in detalhe:
+            continue
+        if aliases.get(partes[1], partes[1]) in TABELAS_GRANDES:
+            passos.append(detalhe)
+    return passos
+
+
+@pytest.mark.parametrize('nome', list(_casos(None)))
+def test_consulta_sem_varredura_completa(base, nome):
+    database, servicos, executados = base
+    chamada, aceitos = _casos(servicos)[nome]
+
+    database.invalidar_cache()
+    executados.clear()
+    chamada()
+    consultas = [sql for sql in executados if sql.split()[0].upper() in ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')]
+    assert consultas, f"{nome}: nenhuma consulta executada"
+
+    with database.conexao_leitura() as conn:
+        problemas = {sql: passos for sql in consultas
+                     if (passos := [p for p in varreduras(conn, sql) if p not in aceitos])}
+    assert not problemas, "\n".join(f"{' '.join(sql.split())[:120]}\n    {passos}" for sql, passos in problemas.items())
+
+
+def test_estoque_na_data_entre_checkpoints(base):
+    """Data antiga: a soma parte do checkpoint anterior e para no seguinte, sem ler o resto do livro"""
+    database, servicos, executados = base
+    database.invalidar_cache()
+    executados.clear()
+    em_fevereiro = servicos.estoque_na_data(1, date(2025, 2, 1)).set_index('id')['estoque']
+    em_marco = servicos.estoque_na_data(1, date(2025, 3, 20)).set_index('id')['estoque']
+    
+    with database.conexao_leitura() as conn:
+        primeiro = dict(conn.execute('''
+            SELECT produto_id, estoque FROM estoque_checkpoint_itens
+            WHERE checkpoint_id = (SELECT MIN(id) FROM estoque_checkpoints)
+        ''').fetchall())
+        assert em_fevereiro.to_dict() == {pid: primeiro[pid] for pid in em_fevereiro.index}
+        assert ((em_marco - em_fevereiro) == 2).all()
+        
+        consulta = next(sql for sql in executados if 'estoque_movimentos NOT INDEXED' in sql)
+        plano = [linha[3] for linha in conn.execute(f'EXPLAIN QUERY PLAN {consulta}')]
+    assert any('rowid>? AND rowid<?' in passo for passo in plano), plano